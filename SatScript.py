@@ -1,66 +1,334 @@
-import fitz  # PyMuPDF
+import argparse
+import glob
+import hashlib
+import io
+import mmap
+import os
 import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+
+import fitz  # PyMuPDF
+
+from sat_cache import ResultCache, file_digest
+from sat_sink import RecordSink
 
 # Ruta del archivo PDF
 pdf_path = "/Users/juancazas/Downloads/cif-LURJ970628UK5_s981iH5sbd.pdf"
 
-# Función para extraer texto del PDF
-def extract_text_from_pdf(pdf_path):
-    doc = fitz.open(pdf_path)
-    text = ""
-    for page in doc:
-        text += page.get_text("text") + "\n"
-    return text
+# Campos que devuelve extract_data, en orden de salida
+FIELDS = ["RFC", "CURP", "Nombre Completo", "Código Postal", "Calle",
+          "Número Exterior", "Colonia", "Municipio", "Estado"]
+
+# Abre un PDF desde una ruta, bytes, memoryview o un objeto tipo archivo sin
+# pasar por archivos temporales. bytes y memoryview se entregan tal cual al
+# stream de PyMuPDF; con use_mmap una ruta local se mapea en memoria en lugar
+# de leerse. El mapeo vive mientras el documento esté abierto.
+@contextmanager
+def open_pdf(source, use_mmap=False):
+    mapped = None
+    if isinstance(source, (str, os.PathLike)):
+        if not use_mmap:
+            with fitz.open(source) as doc:
+                yield doc
+            return
+        with open(source, "rb") as fh:
+            mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        stream = memoryview(mapped)
+    elif isinstance(source, (bytes, bytearray, memoryview, io.BytesIO)):
+        stream = source
+    elif hasattr(source, "read"):
+        stream = source.read()
+    else:
+        raise TypeError(f"Fuente de PDF no soportada: {type(source).__name__}")
+
+    try:
+        with _open_stream(stream) as doc:
+            yield doc
+    finally:
+        if mapped is not None:
+            stream.release()
+            mapped.close()
+
+def _open_stream(stream):
+    try:
+        return fitz.open(stream=stream, filetype="pdf")
+    except TypeError:
+        # Versiones de PyMuPDF sin soporte de memoryview: se copia una vez
+        if isinstance(stream, memoryview):
+            return fitz.open(stream=stream.tobytes(), filetype="pdf")
+        raise
+
+# Función para extraer texto del PDF.
+# Los campos de la CIF están en las primeras páginas: con early_exit se deja de
+# leer en cuanto aparecen todas las etiquetas, y max_pages acota la lectura.
+def extract_text_from_pdf(pdf_path, max_pages=None, early_exit=True):
+    with open_pdf(pdf_path) as doc:
+        return join_pages(read_pages(doc, max_pages, early_exit))
+
+# Genera el texto de cada página bajo demanda
+def iter_page_text(doc, max_pages=None):
+    count = doc.page_count if max_pages is None else min(doc.page_count, max_pages)
+    for number in range(count):
+        yield doc.load_page(number).get_text("text")
+
+# Lee páginas hasta encontrar todas las etiquetas (o agotar max_pages)
+def read_pages(doc, max_pages=None, early_exit=True):
+    pages = []
+    pending = set(LABELS)
+    for page_text in iter_page_text(doc, max_pages):
+        pages.append(page_text)
+        if early_exit:
+            pending.difference_update(find_fields(page_text, pending))
+            if not pending:
+                break
+    return pages
+
+def join_pages(pages):
+    return "".join(f"{page}\n" for page in pages)
+
+# Etiquetas de la constancia y el patrón de su valor. Se compilan una sola vez
+# al importar; find_fields localiza cada etiqueta con str.find (búsqueda literal
+# en C) y solo aplica la expresión regular anclada en esa posición, en lugar de
+# re-escanear todo el texto con un re.search por campo.
+NOT_FOUND = "No encontrado"
+
+LABELS = {
+    "RFC": ("RFC:", r"[\w\d]+"),
+    "CURP": ("CURP:", r"[\w\d]+"),
+    "Nombre": ("Nombre (s):", r".+"),
+    "Primer Apellido": ("Primer Apellido:", r".+"),
+    "Segundo Apellido": ("Segundo Apellido:", r".+"),
+    "Código Postal": ("Código Postal:", r"\d+"),
+    "Calle": ("Nombre de Vialidad:", r".+"),
+    "Número Exterior": ("Número Exterior:", r"\d+"),
+    "Colonia": ("Nombre de la Colonia:", r".+"),
+    "Municipio": ("Nombre del Municipio o Demarcación Territorial:", r".+"),
+    "Estado": ("Nombre de la Entidad Federativa:", r".+"),
+}
+
+# Versión del extractor para la caché de resultados: el prefijo se incrementa a
+# mano al cambiar la lógica de extract_data y el hash cambia solo con LABELS
+EXTRACTOR_VERSION = "1-" + hashlib.sha256(repr(LABELS).encode("utf-8")).hexdigest()[:12]
+
+_COMPILED = [
+    (key, label, re.compile(re.escape(label) + r"\s*(" + value + ")"))
+    for key, (label, value) in LABELS.items()
+]
+
+# Devuelve {campo: valor} con la primera aparición de cada etiqueta encontrada;
+# keys limita la búsqueda a esos campos
+def find_fields(text, keys=None):
+    found = {}
+    for key, label, pattern in _COMPILED:
+        if keys is not None and key not in keys:
+            continue
+        pos = text.find(label)
+        while pos != -1:
+            match = pattern.match(text, pos)
+            if match:
+                found[key] = match.group(1)
+                break
+            pos = text.find(label, pos + 1)
+    return found
 
 # Función para extraer datos usando expresiones regulares
 def extract_data(text):
+    return build_data(find_fields(text))
+
+# Arma el resultado de extract_data a partir de {campo: valor}; lo comparten
+# el motor de regex y el de coordenadas (sat_layout)
+def build_data(found):
     data = {}
 
     # Extraer información clave de manera segura
-    data["RFC"] = re.search(r"RFC:\s*([\w\d]+)", text)
-    data["CURP"] = re.search(r"CURP:\s*([\w\d]+)", text)
-
-    data["RFC"] = data["RFC"].group(1) if data["RFC"] else "No encontrado"
-    data["CURP"] = data["CURP"].group(1) if data["CURP"] else "No encontrado"
-
-    # Extraer nombre, apellido paterno y materno
-    nombre = re.search(r"Nombre \(s\):\s*(.+)", text)
-    apellido1 = re.search(r"Primer Apellido:\s*(.+)", text)
-    apellido2 = re.search(r"Segundo Apellido:\s*(.+)", text)
+    data["RFC"] = found.get("RFC", NOT_FOUND)
+    data["CURP"] = found.get("CURP", NOT_FOUND)
 
     # Construir nombre completo
     nombres = [
-        nombre.group(1) if nombre else "",
-        apellido1.group(1) if apellido1 else "",
-        apellido2.group(1) if apellido2 else ""
+        found.get("Nombre", ""),
+        found.get("Primer Apellido", ""),
+        found.get("Segundo Apellido", "")
     ]
     data["Nombre Completo"] = " ".join(filter(None, nombres))
 
     # Extraer otros datos de dirección
-    campos = {
-        "Código Postal": r"Código Postal:\s*(\d+)",
-        "Calle": r"Nombre de Vialidad:\s*(.+)",
-        "Número Exterior": r"Número Exterior:\s*(\d+)",
-        "Colonia": r"Nombre de la Colonia:\s*(.+)",
-        "Municipio": r"Nombre del Municipio o Demarcación Territorial:\s*(.+)",
-        "Estado": r"Nombre de la Entidad Federativa:\s*(.+)"
-    }
-
-    for key, pattern in campos.items():
-        match = re.search(pattern, text)
-        data[key] = match.group(1) if match else "No encontrado"
+    for key in ("Código Postal", "Calle", "Número Exterior", "Colonia", "Municipio", "Estado"):
+        data[key] = found.get(key, NOT_FOUND)
 
     return data
 
-# Extraer texto y obtener los datos
-pdf_text = extract_text_from_pdf(pdf_path)
+# Procesa un PDF completo; se ejecuta dentro de los procesos del pool.
+# Devuelve (ruta, datos, páginas, error) para no tumbar el lote por un PDF dañado.
+def process_pdf(path, max_pages=None, early_exit=True, use_mmap=False, engine="regex"):
+    try:
+        data, pages = extract_from_source(path, max_pages, early_exit, use_mmap, engine)
+        return path, data, pages, None
+    except Exception as exc:
+        return path, None, 0, f"{type(exc).__name__}: {exc}"
+
+# Extrae los campos de cualquier fuente aceptada por open_pdf (p. ej. el cuerpo
+# de una petición HTTP) y devuelve (datos, páginas leídas).
+# engine="layout" usa las coordenadas de las palabras en lugar del texto plano.
+def extract_from_source(source, max_pages=None, early_exit=True, use_mmap=False, engine="regex"):
+    with open_pdf(source, use_mmap) as doc:
+        if engine == "layout":
+            from sat_layout import find_fields_layout
+            found, pages_read = find_fields_layout(doc, max_pages, early_exit)
+            return build_data(found), pages_read
+        pages = read_pages(doc, max_pages, early_exit)
+    return extract_data(join_pages(pages)), len(pages)
+
+# Expande directorios, globs y listas de archivos (--file-list) a rutas de PDF
+def collect_pdfs(inputs, file_list=None):
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            paths.extend(sorted(str(p) for p in Path(item).glob("*.pdf")))
+        elif glob.has_magic(item):
+            paths.extend(sorted(glob.glob(item, recursive=True)))
+        else:
+            paths.append(item)
+    if file_list:
+        with open(file_list, encoding="utf-8") as fh:
+            paths.extend(line.strip() for line in fh if line.strip())
+    return paths
+
+# Ejecuta la extracción en paralelo; map() conserva el orden de entrada
+def extract_batch(paths, workers=None, chunksize=1, cache=None, **options):
+    if cache is not None:
+        yield from _extract_cached(paths, workers, chunksize, cache, **options)
+        return
+    worker = partial(process_pdf, **options)
+    if workers == 1:
+        yield from map(worker, paths)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(worker, paths, chunksize=chunksize)
+
+# Resuelve primero la caché en el proceso principal y solo manda al pool los PDFs
+# cuyo contenido no se ha visto; los duplicados dentro del lote se extraen una vez
+# y, si esa extracción falla, reciben el mismo error. Un duplicado nunca se
+# extrae, así que cuenta como acierto: aciertos + fallos = PDFs con huella.
+def _extract_cached(paths, workers, chunksize, cache, **options):
+    digests = []
+    known = {}
+    failed = {}
+    misses = []
+    for path in paths:
+        try:
+            digest = file_digest(path)
+        except OSError:
+            digest = None
+        digests.append(digest)
+        if digest is None:
+            misses.append(path)
+        elif digest not in known:
+            known[digest] = cache.get(digest)
+            if known[digest] is None:
+                misses.append(path)
+        else:
+            cache.hits += 1
+
+    results = extract_batch(misses, workers, chunksize, **options)
+    for path, digest in zip(paths, digests):
+        if digest is not None and known[digest] is not None:
+            yield path, known[digest], 0, None
+            continue
+        if digest in failed:
+            yield path, None, 0, failed[digest]
+            continue
+        result = next(results)
+        if digest is not None:
+            if result[3] is None:
+                cache.put(digest, result[1])
+                known[digest] = result[1]
+            else:
+                failed[digest] = result[3]
+        yield result
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extrae datos de Constancias de Situación Fiscal (CIF) del SAT.")
+    parser.add_argument("inputs", nargs="*", default=[pdf_path], help="PDFs, directorios o globs (ej. 'cifs/**/*.pdf')")
+    parser.add_argument("--file-list", help="Archivo de texto con una ruta de PDF por línea")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Número de procesos (1 = sin pool)")
+    parser.add_argument("--chunksize", type=int, default=8, help="PDFs enviados a cada proceso por tarea")
+    parser.add_argument("--max-pages", type=int, help="Leer como máximo N páginas por PDF")
+    parser.add_argument("--all-pages", action="store_true", help="No detenerse al encontrar todos los campos")
+    parser.add_argument("--engine", choices=["regex", "layout"], default="regex",
+                        help="regex sobre el texto plano o coordenadas de palabras (sat_layout)")
+    parser.add_argument("--mmap", action="store_true", help="Mapear cada PDF en memoria en lugar de leerlo")
+    parser.add_argument("--cache", help="Archivo SQLite para cachear resultados por contenido del PDF")
+    parser.add_argument("--cache-size", type=int, default=100_000, help="Máximo de entradas en la caché (LRU)")
+    parser.add_argument("--output", help="Escribe un registro por PDF en este archivo ('-' = stdout)")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl", help="Formato de --output")
+    parser.add_argument("--batch-size", type=int, default=100, help="Registros por escritura en --output")
+    parser.add_argument("--append", action="store_true", help="Agregar a --output en lugar de reemplazarlo")
+    args = parser.parse_args(argv)
+
+    paths = collect_pdfs(args.inputs, args.file_list)
+    if not paths:
+        print("No se encontraron PDFs para procesar.", file=sys.stderr)
+        return 1
+
+    sink = None
+    if args.output:
+        sink = RecordSink(args.output, args.format, ["archivo", *FIELDS, "error"], args.batch_size,
+                          append=args.append)
+
+    cache = None
+    if args.cache:
+        # El motor y max_pages pueden cambiar el resultado: forman parte de la versión
+        version = f"{EXTRACTOR_VERSION}-{args.engine}"
+        if args.max_pages is not None:
+            version += f"-p{args.max_pages}"
+        cache = ResultCache(args.cache, version, args.cache_size)
+
+    inicio = time.perf_counter()
+    total_pages = 0
+    errores = 0
+    options = {"max_pages": args.max_pages, "early_exit": not args.all_pages, "use_mmap": args.mmap,
+               "engine": args.engine}
+    for path, datos_extraidos, pages, error in extract_batch(paths, args.workers, args.chunksize, cache, **options):
+        total_pages += pages
+        if sink:
+            errores += bool(error)
+            sink.write({"archivo": path, **(datos_extraidos or {}), "error": error})
+            continue
+        if len(paths) > 1:
+            print(f"== {path}")
+        if error:
+            errores += 1
+            print(f"Error: {error}")
+            continue
+
+        # Mostrar resultados
+        for key, value in datos_extraidos.items():
+            print(f"{key}: {value}")
+
+    if sink:
+        sink.close()
+    if cache:
+        stats = cache.stats()
+        cache.close()
 
-# Depuración: ver el texto extraído del PDF
-# print("Texto extraído del PDF:\n", pdf_text)
+    duracion = max(time.perf_counter() - inicio, 1e-9)
+    docs = len(paths) - errores
+    print(
+        f"\n{docs} PDFs ({errores} con error), {total_pages} páginas en {duracion:.2f}s "
+        f"-> {docs / duracion:.1f} docs/s, {total_pages / duracion:.1f} páginas/s",
+        file=sys.stderr,
+    )
+    if cache:
+        print(f"Caché: {stats['hits']} aciertos, {stats['misses']} fallos "
+              f"({stats['hit_rate']:.0%}), {stats['evictions']} desalojos", file=sys.stderr)
+    return 0 if not errores else 2
 
-# Obtener los datos estructurados
-datos_extraidos = extract_data(pdf_text)
 
-# Mostrar resultados
-for key, value in datos_extraidos.items():
-    print(f"{key}: {value}")
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Mide el arranque de create-.Net en --help y --plan.
+
+Lanza cada comando N veces como proceso nuevo y compara la mediana con la de
+`python -c pass`: la diferencia es lo que cuestan nuestros imports y el
+parser, y debe quedar bajo el presupuesto (50 ms). Con -X importtime muestra
+los módulos que más pesan en cada caso. Sale con código 1 si algún comando se
+pasa del presupuesto, para usarlo como chequeo en CI.
+
+Uso: python benchmarks/bench_arranque.py [--repeticiones 15] [--presupuesto-ms 50]
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+DIR_CLI = Path(__file__).resolve().parent.parent / "create-.Net"
+MAIN = str(DIR_CLI / "main.py")
+
+
+def comandos(destino):
+    return {
+        "--help": [MAIN, "--help"],
+        "--plan": [MAIN, "--plan", "--sln", "Bench", "--api", "Api", "--path", destino, "--puerto", "5000"],
+    }
+
+
+def medir(argv, repeticiones):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        subprocess.run([sys.executable, *argv], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+        tiempos.append(time.perf_counter() - inicio)
+    return statistics.median(tiempos)
+
+
+def importtime(argv):
+    # [(acumulado µs, módulo)] importados directamente por el script según -X importtime
+    salida = subprocess.run([sys.executable, "-X", "importtime", *argv],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True).stderr
+    filas = []
+    for linea in salida.splitlines():
+        partes = linea.split("|")
+        if len(partes) != 3 or not partes[1].strip().isdigit():
+            continue
+        modulo = partes[2]
+        if modulo.startswith(" ") and not modulo.startswith("   "):  # solo imports directos del script
+            filas.append((int(partes[1]), modulo.strip()))
+    return filas
+
+
+def imports_pesados(argv, cuantos, interprete=frozenset()):
+    # Los más pesados de mayor a menor, sin los que ya carga `python -c pass` (site, encodings...)
+    return sorted(f for f in importtime(argv) if f[1] not in interprete)[::-1][:cuantos]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeticiones", type=int, default=15)
+    parser.add_argument("--presupuesto-ms", type=float, default=50)
+    parser.add_argument("--modulos", type=int, default=5, help="Imports más pesados a mostrar por comando")
+    args = parser.parse_args()
+
+    base = medir(["-c", "pass"], args.repeticiones)
+    interprete = {modulo for _, modulo in importtime(["-c", "pass"])}
+    print(f"python -c pass: {base * 1e3:.1f} ms (mediana de {args.repeticiones})")
+    print(f"{'comando':<8} {'total ms':>9} {'propio ms':>10}")
+    excedidos = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for nombre, argv in comandos(tmp).items():
+            total = medir(argv, args.repeticiones)
+            propio = (total - base) * 1e3
+            print(f"{nombre:<8} {total * 1e3:>9.1f} {propio:>10.1f}")
+            for acumulado, modulo in imports_pesados(argv, args.modulos, interprete):
+                print(f"    {acumulado / 1e3:7.1f} ms  {modulo}")
+            if propio >= args.presupuesto_ms:
+                excedidos.append(nombre)
+    if excedidos:
+        print(f"Fuera de presupuesto ({args.presupuesto_ms:.0f} ms sobre el intérprete): {', '.join(excedidos)}")
+        sys.exit(1)
+    print(f"Dentro de presupuesto ({args.presupuesto_ms:.0f} ms sobre el intérprete)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Mide la generación de código de create-.Net para muchas entidades.
+
+Arma un esquema sintético de N entidades, renderiza todo el proyecto en
+memoria (plantillas/entidad por entidad y plantillas/api una vez) y lo escribe
+en un directorio temporal. Reporta tiempo real y CPU de Python de cada etapa,
+en serie y repartido entre procesos.
+
+Uso: python benchmarks/bench_entidades.py [--entidades 500] [--campos 8]
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "create-.Net"))
+
+from arbol import escribir_arbol  # noqa: E402
+from esquema import normalizar  # noqa: E402
+from estructura import renderizar_proyecto  # noqa: E402
+
+TIPOS = ["string", "decimal", "int", "DateTime", "bool", "string?", "Guid", "long"]
+
+
+def esquema_sintetico(n, campos):
+    return normalizar([
+        {"nombre": f"Entidad{i}", "campos": {f"Campo{j}": TIPOS[j % len(TIPOS)] for j in range(campos)}}
+        for i in range(n)
+    ])
+
+
+def medir(funcion):
+    real, cpu = time.perf_counter(), time.process_time()
+    resultado = funcion()
+    return resultado, time.perf_counter() - real, time.process_time() - cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entidades", type=int, default=500)
+    parser.add_argument("--campos", type=int, default=8)
+    parser.add_argument("--procesos", type=int, nargs="+", default=[1, 4])
+    args = parser.parse_args()
+
+    entidades = esquema_sintetico(args.entidades, args.campos)
+    renderizar_proyecto("Bench", entidades[:1], procesos=1)  # carga y compila las plantillas
+
+    print(f"{args.entidades} entidades x {args.campos} campos")
+    print(f"{'etapa':<24} {'real ms':>9} {'cpu ms':>9} {'archivos':>9}")
+    for procesos in args.procesos:
+        archivos, real, cpu = medir(lambda: renderizar_proyecto("Bench", entidades, procesos=procesos))
+        print(f"{f'render ({procesos} proc)':<24} {real * 1e3:>9.1f} {cpu * 1e3:>9.1f} {len(archivos):>9}")
+    for hilos in (1, None):
+        for atomico in (False, True):
+            with tempfile.TemporaryDirectory() as tmp:
+                n, real, cpu = medir(lambda: escribir_arbol(Path(tmp) / "Bench", archivos, hilos=hilos, atomico=atomico))
+            etapa = f"escritura ({'1 hilo' if hilos == 1 else 'pool'}{', atómica' if atomico else ''})"
+            print(f"{etapa:<24} {real * 1e3:>9.1f} {cpu * 1e3:>9.1f} {n:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Micro-benchmark del extractor de campos de SatScript.
+
+Compara sobre texto sintético de CIF de varias páginas:
+  - legacy: el bucle original con un re.search por campo
+  - alternation: una sola regex con alternancia y grupos con nombre
+  - extract_data: el índice de etiquetas compilado de SatScript
+
+Uso: python benchmarks/bench_extract.py [--pages 1 3 10] [--number 2000]
+"""
+import argparse
+import random
+import re
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from SatScript import LABELS, NOT_FOUND, extract_data  # noqa: E402
+
+_NOISE = ["SERVICIO", "DE", "ADMINISTRACIÓN", "TRIBUTARIA", "Régimen", "Fecha",
+          "Actividad", "Económica", "Porcentaje", "Obligaciones", "Vencimiento"]
+
+_CIF_BODY = """RFC: LURJ970628UK5
+CURP: LURJ970628HDFNZN05
+Nombre (s): JUAN
+Primer Apellido: LUNA
+Segundo Apellido: RUIZ
+Código Postal: 06700
+Nombre de Vialidad: AVENIDA REFORMA
+Número Exterior: 120
+Nombre de la Colonia: CENTRO
+Nombre del Municipio o Demarcación Territorial: CUAUHTÉMOC
+Nombre de la Entidad Federativa: CIUDAD DE MÉXICO
+"""
+
+
+def synthetic_text(pages, seed=0, lines_per_page=60):
+    rnd = random.Random(seed)
+    noise = lambda n: "\n".join(" ".join(rnd.choice(_NOISE) for _ in range(8)) for _ in range(n))
+    return noise(20) + "\n" + _CIF_BODY + "\n".join(noise(lines_per_page) for _ in range(pages - 1)) + "\n"
+
+
+def extract_data_legacy(text):
+    data = {}
+    data["RFC"] = re.search(r"RFC:\s*([\w\d]+)", text)
+    data["CURP"] = re.search(r"CURP:\s*([\w\d]+)", text)
+    data["RFC"] = data["RFC"].group(1) if data["RFC"] else "No encontrado"
+    data["CURP"] = data["CURP"].group(1) if data["CURP"] else "No encontrado"
+    nombre = re.search(r"Nombre \(s\):\s*(.+)", text)
+    apellido1 = re.search(r"Primer Apellido:\s*(.+)", text)
+    apellido2 = re.search(r"Segundo Apellido:\s*(.+)", text)
+    nombres = [
+        nombre.group(1) if nombre else "",
+        apellido1.group(1) if apellido1 else "",
+        apellido2.group(1) if apellido2 else ""
+    ]
+    data["Nombre Completo"] = " ".join(filter(None, nombres))
+    campos = {
+        "Código Postal": r"Código Postal:\s*(\d+)",
+        "Calle": r"Nombre de Vialidad:\s*(.+)",
+        "Número Exterior": r"Número Exterior:\s*(\d+)",
+        "Colonia": r"Nombre de la Colonia:\s*(.+)",
+        "Municipio": r"Nombre del Municipio o Demarcación Territorial:\s*(.+)",
+        "Estado": r"Nombre de la Entidad Federativa:\s*(.+)"
+    }
+    for key, pattern in campos.items():
+        match = re.search(pattern, text)
+        data[key] = match.group(1) if match else "No encontrado"
+    return data
+
+
+# Una sola pasada: cada alternativa va en un lookahead para conservar la
+# semántica de re.search (primera aparición de cada campo, aunque se solapen)
+_KEYS = list(LABELS)
+_ALTERNATION = re.compile("|".join(
+    f"(?={re.escape(label)}\\s*(?P<g{i}>{value}))" for i, (label, value) in enumerate(LABELS.values())
+))
+
+
+def extract_data_alternation(text):
+    found = {}
+    for match in _ALTERNATION.finditer(text):
+        key = _KEYS[int(match.lastgroup[1:])]
+        found.setdefault(key, match.group(match.lastgroup))
+        if len(found) == len(_KEYS):
+            break
+    data = {"RFC": found.get("RFC", NOT_FOUND), "CURP": found.get("CURP", NOT_FOUND)}
+    nombres = [found.get("Nombre", ""), found.get("Primer Apellido", ""), found.get("Segundo Apellido", "")]
+    data["Nombre Completo"] = " ".join(filter(None, nombres))
+    for key in ("Código Postal", "Calle", "Número Exterior", "Colonia", "Municipio", "Estado"):
+        data[key] = found.get(key, NOT_FOUND)
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 3, 10])
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    impls = [("legacy", extract_data_legacy), ("alternation", extract_data_alternation), ("extract_data", extract_data)]
+    print(f"{'páginas':>8} {'caso':>12} " + " ".join(f"{name:>14}" for name, _ in impls) + f" {'speedup':>8}")
+    for pages in args.pages:
+        complete = synthetic_text(pages)
+        # Peor caso: un campo ausente obliga a recorrer todo el documento
+        missing = complete.replace("CURP:", "CURP ")
+        for case, text in (("completo", complete), ("falta CURP", missing)):
+            expected = extract_data_legacy(text)
+            times = []
+            for name, fn in impls:
+                assert fn(text) == expected, f"{name} difiere del extractor original"
+                best = min(timeit.repeat(lambda: fn(text), number=args.number, repeat=5))
+                times.append(best / args.number * 1e6)
+            print(f"{pages:>8} {case:>12} " + " ".join(f"{t:>12.1f}µs" for t in times)
+                  + f" {times[0] / times[-1]:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Compara el motor de regex con el de coordenadas (sat_layout).
+
+Para cada maquetación del corpus sintético (inline, columns, wrapped) mide la
+precisión contra el manifiesto y la latencia por página de cada motor,
+incluyendo la llamada a get_text de PyMuPDF que cada uno necesita.
+
+Uso: python benchmarks/bench_layout.py [--count 200] [--blank 0.1]
+"""
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import fitz  # noqa: E402
+
+from SatScript import build_data, extract_data, join_pages, read_pages  # noqa: E402
+from sat_corpus import generate_corpus, load_manifest  # noqa: E402
+from sat_layout import find_fields_layout  # noqa: E402
+
+
+def regex_engine(doc):
+    pages = read_pages(doc)
+    return extract_data(join_pages(pages)), len(pages)
+
+
+def layout_engine(doc):
+    found, pages = find_fields_layout(doc)
+    return build_data(found), pages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 2, 3])
+    parser.add_argument("--blank", type=float, default=0.1, help="Probabilidad de campos vacíos")
+    parser.add_argument("--layouts", nargs="+", default=["inline", "columns", "wrapped"])
+    args = parser.parse_args()
+
+    engines = [("regex", regex_engine), ("layout", layout_engine)]
+    print(f"{'maquetación':<12} {'motor':<7} {'precisión':>10} {'µs/página':>10} {'p95 µs':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for layout in args.layouts:
+            manifest = generate_corpus(Path(tmp) / layout, args.count, args.pages, layout=layout, blank=args.blank)
+            entries = load_manifest(manifest)
+            docs = [(fitz.open(e["archivo"]), e["esperado"]) for e in entries]
+            for name, engine in engines:
+                correct = 0
+                per_page = []
+                for doc, expected in docs:
+                    inicio = time.perf_counter()
+                    data, pages = engine(doc)
+                    per_page.append((time.perf_counter() - inicio) / max(pages, 1))
+                    correct += data == expected
+                per_page.sort()
+                print(f"{layout:<12} {name:<7} {correct / len(docs):>10.1%} "
+                      f"{statistics.fmean(per_page) * 1e6:>10.1f} {per_page[int(0.95 * len(per_page))] * 1e6:>10.1f}")
+            for doc, _ in docs:
+                doc.close()
+
+
+if __name__ == "__main__":
+    main()
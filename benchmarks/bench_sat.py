@@ -0,0 +1,144 @@
+"""Suite de rendimiento de SatScript sobre corpus sintéticos de CIF.
+
+Para cada tamaño de corpus genera (o reutiliza) las CIF con sat_corpus y mide
+por documento las etapas open (fitz.open), text (lectura de páginas) y regex
+(extract_data), además del pico de RSS. Cada tamaño corre en un proceso nuevo
+para que el pico de memoria no se arrastre entre mediciones.
+
+Uso:
+  python benchmarks/bench_sat.py --sizes 10 100 1000 --save-baseline base.json
+  python benchmarks/bench_sat.py --sizes 10 100 1000 --compare base.json
+"""
+import argparse
+import json
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+STAGES = ("open", "text", "regex")
+
+
+def _percentile(values, p):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+
+def run_size(corpus_dir, size, pages, noise, layout, max_pages, early_exit):
+    import fitz
+    from SatScript import extract_data, join_pages, read_pages
+    from sat_corpus import generate_corpus, load_manifest
+
+    manifest = Path(corpus_dir) / f"n{size}" / "manifest.jsonl"
+    if not manifest.exists():
+        generate_corpus(manifest.parent, size, pages, noise, layout)
+    entries = load_manifest(manifest)
+
+    timings = {stage: [] for stage in STAGES}
+    pages_read = 0
+    correct = 0
+    inicio = time.perf_counter()
+    for entry in entries:
+        t0 = time.perf_counter()
+        doc = fitz.open(entry["archivo"])
+        t1 = time.perf_counter()
+        pages = read_pages(doc, max_pages, early_exit)
+        text = join_pages(pages)
+        t2 = time.perf_counter()
+        data = extract_data(text)
+        t3 = time.perf_counter()
+        doc.close()
+        pages_read += len(pages)
+        timings["open"].append(t1 - t0)
+        timings["text"].append(t2 - t1)
+        timings["regex"].append(t3 - t2)
+        correct += data == entry["esperado"]
+    total = time.perf_counter() - inicio
+
+    return {
+        "size": size,
+        "docs_per_s": round(len(entries) / total, 2),
+        "pages_per_s": round(pages_read / total, 2),
+        "accuracy": round(correct / len(entries), 4),
+        "stages_ms": {
+            stage: {
+                "mean": round(statistics.fmean(values) * 1000, 4),
+                "p95": round(_percentile(values, 95) * 1000, 4),
+                "total": round(sum(values) * 1000, 2),
+            }
+            for stage, values in timings.items()
+        },
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Imprime la variación contra el baseline y devuelve True si hay regresión."""
+    previous = {r["size"]: r for r in baseline["results"]}
+    regression = False
+    for result in results:
+        old = previous.get(result["size"])
+        if not old:
+            continue
+        for stage in STAGES:
+            before, after = old["stages_ms"][stage]["mean"], result["stages_ms"][stage]["mean"]
+            change = (after - before) / before if before else 0.0
+            flag = ""
+            if change > tolerance:
+                regression = True
+                flag = "  <-- REGRESIÓN"
+            print(f"  n={result['size']:<6} {stage:<6} {before:>9.3f}ms -> {after:>9.3f}ms ({change:+.1%}){flag}")
+    return regression
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--corpus-dir", help="Directorio para reutilizar corpus entre corridas (default: temporal)")
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 2, 3])
+    parser.add_argument("--noise", type=float, default=0.5)
+    parser.add_argument("--layout", choices=["inline", "columns", "wrapped"], default="inline")
+    parser.add_argument("--max-pages", type=int)
+    parser.add_argument("--all-pages", action="store_true")
+    parser.add_argument("--save-baseline", help="Guardar resultados como baseline JSON")
+    parser.add_argument("--compare", help="Comparar contra un baseline JSON")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Regresión tolerada por etapa (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus_dir = args.corpus_dir or tmp
+        results = []
+        for size in args.sizes:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                result = pool.submit(run_size, corpus_dir, size, args.pages, args.noise, args.layout,
+                                     args.max_pages, not args.all_pages).result()
+            results.append(result)
+            stages = "  ".join(f"{s}={result['stages_ms'][s]['mean']:.3f}ms" for s in STAGES)
+            print(f"n={size:<6} {result['docs_per_s']:>8.1f} docs/s  {stages}  "
+                  f"RSS={result['peak_rss_mb']}MB  precisión={result['accuracy']:.1%}")
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {"pages": args.pages, "noise": args.noise, "layout": args.layout,
+                   "max_pages": args.max_pages, "early_exit": not args.all_pages},
+        "results": results,
+    }
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"Baseline guardado en {args.save_baseline}")
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        print(f"Comparación contra {args.compare}:")
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
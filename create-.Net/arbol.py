@@ -0,0 +1,114 @@
+import os
+import shutil
+import stat
+from pathlib import Path
+
+# Escritura de un árbol de archivos completo a partir de un mapa en memoria
+# {ruta relativa: texto o bytes}. Pensado para muchos archivos pequeños sobre
+# discos lentos o de red (workspaces de CI montados por NFS), donde cada
+# llamada al sistema cuesta un viaje al servidor:
+#   - los directorios se crean en una sola pasada, solo las hojas (mkdir con
+#     parents crea los intermedios) y cada uno una vez;
+#   - los archivos se escriben en paralelo con un pool de hilos a partir de
+#     UMBRAL_HILOS archivos (la escritura suelta la GIL mientras espera E/S);
+#   - las carpetas pedidas que quedan vacías reciben un .gitkeep; las que ya
+#     tienen archivos, en el mapa o en disco, no;
+#   - con atomico el árbol se arma en un directorio temporal dentro del
+#     destino (mismo sistema de archivos) y se mueve con rename: un
+#     subdirectorio nuevo aparece completo de una vez o no aparece. Donde ya
+#     existe un directorio se mezcla entrada por entrada, y cada archivo se
+#     reemplaza también con un rename.
+
+UMBRAL_HILOS = 16
+HILOS = 8
+GITKEEP = ".gitkeep"
+
+
+def _hojas(directorios):
+    # Los directorios que no son padres de otro del conjunto
+    ordenados = sorted(directorios, key=lambda d: d.parts)
+    return [d for d, siguiente in zip(ordenados, ordenados[1:] + [None])
+            if siguiente is None or d not in siguiente.parents]
+
+
+def _escribir(lote):
+    for ruta, contenido in lote:
+        ruta.write_bytes(contenido.encode("utf-8") if isinstance(contenido, str) else contenido)
+
+
+def _volcar(base_path, archivos, carpetas, hilos):
+    rutas = {base_path / relativo: contenido for relativo, contenido in archivos.items()}
+    directorios = {ruta.parent for ruta in rutas} | {base_path / carpeta for carpeta in carpetas} | {base_path}
+    for directorio in _hojas(directorios):
+        directorio.mkdir(parents=True, exist_ok=True)
+
+    hilos = hilos or HILOS
+    if len(rutas) < UMBRAL_HILOS or hilos == 1:
+        _escribir(rutas.items())
+        return
+    from concurrent.futures import ThreadPoolExecutor
+    # Un lote por hilo: un future por archivo cuesta más que el write en disco local
+    pares = list(rutas.items())
+    with ThreadPoolExecutor(max_workers=hilos) as pool:
+        # list() propaga el primer error de escritura
+        list(pool.map(_escribir, (pares[i::hilos] for i in range(hilos))))
+
+
+def _modo_normal(temporal):
+    # mkdtemp crea el directorio con 0700; el árbol final debe quedar con el
+    # modo de un mkdir normal (0777 menos la umask). La umask no se puede leer
+    # sin cambiarla (os.umask afecta a todos los hilos), así que se mide con
+    # un directorio de prueba
+    prueba = temporal / ".modo"
+    prueba.mkdir()
+    try:
+        return stat.S_IMODE(prueba.stat().st_mode)
+    finally:
+        prueba.rmdir()
+
+
+def _mover(origen, destino):
+    if destino.is_dir() and not destino.is_symlink():
+        for entrada in origen.iterdir():
+            _mover(entrada, destino / entrada.name)
+    else:
+        os.replace(origen, destino)
+
+
+def escribir_arbol(base_path, archivos, carpetas=(), hilos=None, atomico=False):
+    # archivos: {ruta relativa: texto|bytes}; carpetas: directorios que deben
+    # existir aunque no reciban archivos. Devuelve cuántos archivos escribió
+    base_path = Path(base_path)
+    archivos = dict(archivos)
+    ocupadas = {Path(relativo).parent for relativo in archivos}
+    ocupadas |= {padre for d in ocupadas for padre in d.parents}
+    for carpeta in carpetas:
+        carpeta = Path(carpeta)
+        destino = base_path / carpeta
+        if carpeta in ocupadas or (destino.is_dir() and any(destino.iterdir())):
+            continue
+        archivos[carpeta / GITKEEP] = b""
+
+    if not atomico:
+        _volcar(base_path, archivos, carpetas, hilos)
+        return len(archivos)
+
+    nuevo = not base_path.exists()
+    padre = base_path.parent if nuevo else base_path
+    padre.mkdir(parents=True, exist_ok=True)
+    import tempfile  # diferido: solo el modo atómico lo usa y huellas entra en --plan
+    temporal = Path(tempfile.mkdtemp(prefix=f".{base_path.name}-", dir=padre))
+    try:
+        temporal.chmod(_modo_normal(temporal))
+        _volcar(temporal, archivos, carpetas, hilos)
+        if nuevo:
+            try:
+                temporal.rename(base_path)
+                return len(archivos)
+            except OSError:
+                # Otra ejecución creó el destino mientras tanto: mezclar
+                pass
+        _mover(temporal, base_path)
+    finally:
+        shutil.rmtree(temporal, ignore_errors=True)
+    return len(archivos)
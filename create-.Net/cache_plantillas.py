@@ -0,0 +1,129 @@
+import os
+import re
+import shlex
+import shutil
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+from arbol import escribir_arbol
+from colores import print_info, print_ok
+from comandos import capturar, ejecutar_comando
+from huellas import huella
+
+# Caché local de los esqueletos que genera `dotnet new` (sln, webapi, xunit).
+# Cada plantilla se genera una sola vez con un nombre marcador y se guarda en
+# un directorio cuya llave es el hash de (versión del SDK, plantilla, opciones).
+# En un acierto el proyecto se materializa copiando los archivos y cambiando el
+# marcador por el nombre real, sin invocar el motor de plantillas del CLI.
+
+MARCADOR = "PlantillaCacheProyecto"
+DIR_CACHE = Path(os.environ.get("CREATE_DOTNET_CACHE", Path.home() / ".cache" / "create-dotnet" / "plantillas"))
+PLANTILLAS = ["sln", "webapi", "xunit"]
+
+# Nombres que el reemplazo textual del marcador reproduce igual que `dotnet new`
+_NOMBRE_SEGURO = re.compile(r"[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*")
+
+# Un candado por entrada de la caché: en un manifiesto todos los servicios
+# piden la misma plantilla a la vez y solo uno debe generarla
+_candados = {}
+_candado_global = threading.Lock()
+
+
+def _candado(destino):
+    with _candado_global:
+        return _candados.setdefault(destino, threading.Lock())
+
+
+@lru_cache(maxsize=None)
+def version_sdk():
+    return capturar(["dotnet", "--version"]).strip() or "desconocida"
+
+
+def clave(plantilla, opciones=""):
+    texto = f"{version_sdk()}|{plantilla}|{opciones.strip()}"
+    return huella(texto.encode("utf-8"))[:20]
+
+
+def ruta_cache(plantilla, opciones=""):
+    return DIR_CACHE / f"{plantilla}-{clave(plantilla, opciones)}"
+
+
+def calentar(plantilla, opciones="", forzar=False):
+    # Genera la plantilla en un directorio temporal y la mueve a la caché de una
+    # sola vez, así otra ejecución nunca ve una entrada a medio escribir. Una
+    # entrada existente solo se reemplaza con forzar (--calentar-cache)
+    destino = ruta_cache(plantilla, opciones)
+    with _candado(destino):
+        if destino.exists() and not forzar:
+            return destino
+        DIR_CACHE.mkdir(parents=True, exist_ok=True)
+        import tempfile  # diferido: solo al generar una entrada nueva
+        temporal = Path(tempfile.mkdtemp(prefix=f".{plantilla}-", dir=DIR_CACHE))
+        try:
+            restore = [] if plantilla == "sln" else ["--no-restore"]
+            ejecutar_comando(["dotnet", "new", plantilla, "-n", MARCADOR, *restore, *shlex.split(opciones)],
+                             cwd=temporal, salir=False)
+            if destino.exists() and forzar:
+                shutil.rmtree(destino)
+            try:
+                temporal.rename(destino)
+            except OSError:
+                # Otro proceso la guardó primero: se usa la suya
+                return destino
+        finally:
+            shutil.rmtree(temporal, ignore_errors=True)
+    print_ok(f"Plantilla '{plantilla}' guardada en caché: {destino}")
+    return destino
+
+
+def materializar(origen, nombre, cwd):
+    # Arma el proyecto en memoria y lo escribe como un árbol: un proyecto nuevo
+    # aparece en cwd con un solo rename, nunca a medio copiar
+    marcadores = ((MARCADOR, nombre), (MARCADOR.lower(), nombre.lower()))
+    archivos = {}
+    for archivo in origen.rglob("*"):
+        if archivo.is_dir():
+            continue
+        relativo = archivo.relative_to(origen).as_posix()
+        for viejo, nuevo in marcadores:
+            relativo = relativo.replace(viejo, nuevo)
+        destino = Path(cwd) / relativo
+        if destino.exists():
+            # Igual que `dotnet new` sin --force: no pisa un proyecto existente
+            continue
+        datos = archivo.read_bytes()
+        try:
+            texto = datos.decode("utf-8")
+        except UnicodeDecodeError:
+            archivos[relativo] = datos
+            continue
+        for viejo, nuevo in marcadores:
+            texto = texto.replace(viejo, nuevo)
+        archivos[relativo] = texto
+    escribir_arbol(cwd, archivos, atomico=True)
+
+
+def dotnet_new(plantilla, nombre, cwd, opciones="", usar_cache=True):
+    # Equivalente a `dotnet new <plantilla> -n <nombre>` que usa la caché cuando puede.
+    # Si el proyecto ya existe no se regenera: al volver a correr sobre la misma
+    # carpeta solo actúa la regeneración incremental (huellas)
+    existente = Path(cwd) / (f"{nombre}.sln" if plantilla == "sln" else f"{nombre}/{nombre}.csproj")
+    if existente.exists():
+        print_info(f"{existente.name} ya existe, se omite `dotnet new {plantilla}`")
+        return
+    if not usar_cache or not _NOMBRE_SEGURO.fullmatch(nombre):
+        ejecutar_comando(["dotnet", "new", plantilla, "-n", nombre, *shlex.split(opciones)], cwd=cwd, salir=False)
+        return
+    origen = ruta_cache(plantilla, opciones)
+    if origen.exists():
+        print_info(f"Plantilla '{plantilla}' desde caché -> {nombre}")
+    else:
+        origen = calentar(plantilla, opciones)
+    materializar(origen, nombre, cwd)
+
+
+def calentar_todas(forzar=False):
+    for plantilla in PLANTILLAS:
+        calentar(plantilla, forzar=forzar)
+    print_ok(f"Caché de plantillas lista en {DIR_CACHE} (SDK {version_sdk()})")
@@ -1,18 +1,214 @@
-import subprocess
+import os
+import shlex
 import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
 from colores import print_info, print_error, print_ok
+from constantes import LOG_POR_DEFECTO, PRESETS_ENTORNO
+from trazas import registrar, uso_hijo
 
-def ejecutar_comando(cmd, cwd=None):
-    print_info(f"Ejecutando: {cmd}")
+# La salida de los comandos se muestra línea por línea mientras corren (con hora
+# y tiempo transcurrido) y se copia a un log rotativo. En memoria solo se guarda
+# una cola acotada de las últimas líneas para reportar errores, así un restore
+# largo no parece colgado y `dotnet run` no acumula toda su salida.
+
+LINEAS_COLA = 200
+
+_log = None  # se crea en configurar_log: importar logging cuesta ~6 ms y --help/--plan no escriben log
+_consola = threading.Lock()
+
+def configurar_log(ruta=LOG_POR_DEFECTO, max_bytes=5 * 1024 * 1024, copias=3):
+    global _log
+    import logging
+    from logging.handlers import RotatingFileHandler
+    ruta = Path(ruta)
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    _log = logging.getLogger("create-dotnet.comandos")
+    _log.propagate = False
+    for handler in list(_log.handlers):
+        _log.removeHandler(handler)
+        handler.close()
+    handler = RotatingFileHandler(ruta, maxBytes=max_bytes, backupCount=copias, encoding="utf-8")
+    handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+    _log.addHandler(handler)
+    _log.setLevel(logging.INFO)
+    return ruta
+
+def _registrar(mensaje, *args):
+    if _log is not None:
+        _log.info(mensaje, *args)
+
+def _emitir(linea, canal, inicio, etiqueta, cola):
+    linea = linea.rstrip("\r\n")
+    prefijo = f"[{etiqueta}] " if etiqueta else ""
+    cola.append(f"{prefijo}{linea}")
+    _registrar("%s%s %s", prefijo, canal, linea)
+    with _consola:
+        print(f"  {time.strftime('%H:%M:%S')} +{time.monotonic() - inicio:6.1f}s {prefijo}{linea}", flush=True)
+
+def _resultado(argv, returncode, cola, inicio, etiqueta):
+    texto = shlex.join(argv)
+    duracion = time.monotonic() - inicio
+    _registrar("%s terminó con código %s en %.1fs", etiqueta or texto, returncode, duracion)
+    if returncode != 0:
+        print_error(f"Fallo: {texto}")
+        if cola:
+            print_error("Últimas líneas de salida:\n" + "\n".join(cola))
+    else:
+        print_ok(f"Comando exitoso ({duracion:.1f}s): {texto}")
+    # stdout trae solo la cola acotada de la salida (stdout y stderr intercalados)
+    import subprocess  # diferido como en iniciar: --plan no ejecuta comandos
+    return subprocess.CompletedProcess(argv, returncode, "\n".join(cola), "")
+
+def preparar(cmd):
+    # argv del comando (las cadenas se separan con shlex, nunca pasan por un shell)
+    # con el flag de nodeReuse de MSBuild según el servidor de build
+    argv = shlex.split(cmd) if isinstance(cmd, str) else [str(a) for a in cmd]
+    if (len(argv) > 1 and argv[0] == "dotnet" and argv[1] in VERBOS_MSBUILD
+            and not any(a.lower().startswith(("-nodereuse", "/nodereuse", "--nodereuse")) for a in argv)):
+        argv.append(f"-nodeReuse:{'true' if _servidor_build else 'false'}")
+    return argv
+
+def _leer(flujo, canal, emitir):
+    for linea in flujo:
+        emitir(linea, canal)
+
+# Entorno de los comandos. Los presets (constantes.PRESETS_ENTORNO) quitan trabajo de arranque a cada
+# invocación del CLI (telemetría, mensaje de bienvenida y primer uso, avisos de
+# workloads, extracción de XML docs de NuGet). Con el servidor de build las
+# invocaciones de MSBuild reutilizan nodos y el servidor de MSBuild/compilador
+# entre pasos (y entre ejecuciones) en vez de arrancarlos en frío cada vez.
+VERBOS_MSBUILD = {"build", "restore", "publish", "test", "pack", "msbuild", "clean"}
+
+_entorno = None  # None = heredar el entorno del proceso
+_servidor_build = True
+
+def configurar_entorno(preset="rapido", servidor_build=True):
+    global _entorno, _servidor_build
+    _servidor_build = servidor_build
+    variables = dict(PRESETS_ENTORNO[preset])
+    variables.update({
+        "MSBUILDDISABLENODEREUSE": "0" if servidor_build else "1",
+        "DOTNET_CLI_USE_MSBUILD_SERVER": "1" if servidor_build else "0",
+        "UseSharedCompilation": "true" if servidor_build else "false",
+    })
+    _entorno = {**os.environ, **variables}
+    return variables
+
+def apagar_servidor_build():
+    # Para agentes de CI: no dejar el servidor de MSBuild ni VBCSCompiler vivos
+    return ejecutar_comando(["dotnet", "build-server", "shutdown"], etiqueta="build-server")
+
+class BackendSubproceso:
+    # Backend real: cada comando es un subproceso sin shell. La salida se lee en
+    # dos hilos y el hijo se recoge con wait4 para tener su CPU y RSS máximo
+    # (incluye los procesos que lanzó y esperó, p. ej. MSBuild)
+    nombre = "subproceso"
+
+    def iniciar(self, argv, cwd):
+        import subprocess  # ~5 ms de arranque (selectors, signal) que --help y --plan no necesitan
+        return subprocess.Popen(argv, cwd=cwd, env=_entorno, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                text=True, errors="replace", bufsize=1)
+
+    def esperar(self, proc, emitir):
+        lectores = [
+            threading.Thread(target=_leer, args=(flujo, canal, emitir), daemon=True)
+            for flujo, canal in ((proc.stdout, "out"), (proc.stderr, "err"))
+        ]
+        for lector in lectores:
+            lector.start()
+        cpu = rss_kb = None
+        if hasattr(os, "wait4"):
+            _, estado, rusage = os.wait4(proc.pid, 0)
+            proc.returncode = os.waitstatus_to_exitcode(estado)
+            cpu, rss_kb = uso_hijo(rusage)
+        else:
+            proc.wait()
+        for lector in lectores:
+            lector.join()
+        return proc.returncode, cpu, rss_kb
+
+    def terminar(self, proc):
+        if proc.returncode is None:
+            proc.terminate()
+
+
+# Backend activo; se cambia con usar_backend (p. ej. por simulador.DotnetSimulado)
+_backend = BackendSubproceso()
+
+def usar_backend(backend):
+    global _backend
+    anterior, _backend = _backend, backend
+    return anterior
+
+def backend_actual():
+    return _backend
+
+def _esperar(handle, argv, inicio, etiqueta, cola):
+    comienzo = time.perf_counter()
+    if handle is None:
+        # Sin shell no hay "command not found" con código 127: lo reproducimos
+        _emitir(f"{argv[0]}: no se encontró el ejecutable", "err", inicio, etiqueta, cola)
+        return _resultado(argv, 127, cola, inicio, etiqueta)
+    returncode, cpu, rss_kb = _backend.esperar(handle, lambda linea, canal: _emitir(linea, canal, inicio, etiqueta, cola))
+    registrar(etiqueta or shlex.join(argv), "comando", comienzo, time.perf_counter(), cpu=cpu, rss_kb=rss_kb,
+              cmd=shlex.join(argv), codigo=returncode, backend=_backend.nombre)
+    return _resultado(argv, returncode, cola, inicio, etiqueta)
+
+def _iniciar(argv, cwd):
+    try:
+        return _backend.iniciar(argv, cwd)
+    except FileNotFoundError:
+        return None
+
+def ejecutar_comando(cmd, cwd=None, etiqueta=None, salir=True):
+    # cmd: lista argv (o cadena, que se separa con shlex); nunca se usa un shell.
+    # Con salir=False un fallo lanza RuntimeError en lugar de terminar el proceso
+    # (pasos de Python dentro del grafo de tareas)
+    argv = preparar(cmd)
+    print_info(f"Ejecutando: {shlex.join(argv)}")
+    _registrar("$ %s (cwd=%s)", shlex.join(argv), cwd or ".")
+    inicio = time.monotonic()
+    cola = deque(maxlen=LINEAS_COLA)
+    proc = None
     try:
-        res = subprocess.run(cmd, shell=True, cwd=cwd, capture_output=True, text=True)
+        proc = _iniciar(argv, cwd)
+        res = _esperar(proc, argv, inicio, etiqueta, cola)
         if res.returncode != 0:
-            print_error(f"Fallo: {cmd}")
-            if res.stderr:
-                print_error(f"STDERR: {res.stderr.strip()}")
+            if not salir:
+                raise RuntimeError(f"{shlex.join(argv)} terminó con código {res.returncode}")
             sys.exit(1)
-        print_ok("Comando exitoso")
-        return res  # Devuelve resultado completo si necesitas stdout más tarde
+        return res  # stdout contiene las últimas LINEAS_COLA líneas
     except KeyboardInterrupt:
+        if proc is not None:
+            _backend.terminar(proc)
         print_info("\n[INTERRUPT] Ejecución interrumpida por el usuario.")
         sys.exit(0)
+
+async def ejecutar_comando_async(cmd, cwd=None, etiqueta=None):
+    # Variante para el ejecutor de tareas: no termina el proceso, devuelve el resultado.
+    # La espera corre en un hilo para que el resto del grafo siga avanzando
+    import asyncio  # diferido: solo el ejecutor de tareas lo necesita, no --help ni --plan
+    argv = preparar(cmd)
+    print_info(f"Ejecutando: {shlex.join(argv)}")
+    _registrar("$ %s (cwd=%s)", shlex.join(argv), cwd or ".")
+    inicio = time.monotonic()
+    cola = deque(maxlen=LINEAS_COLA)
+    proc = _iniciar(argv, cwd)
+    try:
+        return await asyncio.to_thread(_esperar, proc, argv, inicio, etiqueta, cola)
+    except asyncio.CancelledError:
+        if proc is not None:
+            _backend.terminar(proc)
+        raise
+
+def capturar(cmd, cwd=None):
+    # Ejecuta un comando corto en silencio con el backend activo y devuelve su stdout
+    lineas = []
+    handle = _iniciar(preparar(cmd), cwd)
+    if handle is None:
+        return ""
+    _backend.esperar(handle, lambda linea, canal: canal == "out" and lineas.append(linea.rstrip("\r\n")))
+    return "\n".join(lineas)
@@ -0,0 +1,19 @@
+import os
+
+# Valores que necesita el parser de main.py. Van aparte de comandos para que
+# --help no importe subprocess, threading ni el registro de trazas.
+
+LOG_POR_DEFECTO = os.path.join(os.path.expanduser("~"), ".cache", "create-dotnet", "comandos.log")
+
+PRESETS_ENTORNO = {
+    "ninguno": {},
+    "rapido": {
+        "DOTNET_CLI_TELEMETRY_OPTOUT": "1",
+        "DOTNET_SKIP_FIRST_TIME_EXPERIENCE": "1",
+        "DOTNET_NOLOGO": "1",
+        "DOTNET_CLI_WORKLOAD_UPDATE_NOTIFY_DISABLE": "1",
+        "DOTNET_GENERATE_ASPNET_CERTIFICATE": "false",
+        "NUGET_XMLDOC_MODE": "skip",
+    },
+}
+PRESETS_ENTORNO["ci"] = {**PRESETS_ENTORNO["rapido"], "MSBUILDTERMINALLOGGER": "off", "DOTNET_CLI_UI_LANGUAGE": "en"}
@@ -1,14 +1,47 @@
-from comandos import ejecutar_comando
-from colores import print_info, print_ok
-
-def instalar_paquetes(api_path):
-    print_info("Instalando dependencias necesarias...")
-    ejecutar_comando("dotnet add package Microsoft.EntityFrameworkCore --version 7.0.0", cwd=api_path)
-    ejecutar_comando("dotnet add package Microsoft.EntityFrameworkCore.InMemory --version 7.0.0", cwd=api_path)
-    ejecutar_comando("dotnet add package Swashbuckle.AspNetCore --version 6.0.0", cwd=api_path)
-    ejecutar_comando("dotnet add package Microsoft.AspNetCore.Authentication.JwtBearer", cwd=api_path)
-    ejecutar_comando("dotnet add package Microsoft.EntityFrameworkCore.Sqlite --version 7.0.0", cwd=api_path)
-    ejecutar_comando("dotnet add package Microsoft.EntityFrameworkCore.Design --version 7.0.0", cwd=api_path)
-    ejecutar_comando("dotnet add package Swashbuckle.AspNetCore --version 7.0.0",cwd=api_path)
-    print_ok("Dependencias instaladas correctamente")
+# Paquetes NuGet del proyecto: (nombre, versión, atributos extra).
+# Versión None = última estable ("*"), igual que `dotnet add package` sin --version.
+PAQUETES = [
+    ("Microsoft.EntityFrameworkCore", "7.0.0", {}),
+    ("Microsoft.EntityFrameworkCore.InMemory", "7.0.0", {}),
+    ("Swashbuckle.AspNetCore", "7.0.0", {}),
+    ("Microsoft.AspNetCore.Authentication.JwtBearer", None, {}),
+    ("Microsoft.EntityFrameworkCore.Sqlite", "7.0.0", {}),
+    ("Microsoft.EntityFrameworkCore.Design", "7.0.0", {
+        "PrivateAssets": "all",
+        "IncludeAssets": "runtime; build; native; contentfiles; analyzers; buildtransitive",
+    }),
+]
 
+def escribir_paquetes(csproj_path, paquetes=PAQUETES):
+    # Escribe todos los <PackageReference> en una sola edición del .csproj.
+    # Los que ya existen solo se actualizan de versión.
+    import xml.etree.ElementTree as ET  # diferido: --plan solo necesita PAQUETES
+    parser = ET.XMLParser(target=ET.TreeBuilder(insert_comments=True))
+    tree = ET.parse(csproj_path, parser)
+    root = tree.getroot()
+
+    existentes = {ref.get("Include", "").lower(): ref for ref in root.iter("PackageReference")}
+    grupo = next((g for g in root.findall("ItemGroup") if g.find("PackageReference") is not None), None)
+    if grupo is None:
+        grupo = ET.SubElement(root, "ItemGroup")
+
+    for nombre, version, extras in paquetes:
+        ref = existentes.get(nombre.lower())
+        if ref is None:
+            ref = ET.SubElement(grupo, "PackageReference", Include=nombre)
+            existentes[nombre.lower()] = ref
+        ref.set("Version", version or "*")
+        for tag, valor in extras.items():
+            hijo = ref.find(tag)
+            if hijo is None:
+                hijo = ET.SubElement(ref, tag)
+            hijo.text = valor
+
+    ET.indent(tree, space="  ")
+    nuevo = ET.tostring(root, encoding="utf-8")
+    # Sin cambios no se reescribe: tocar el .csproj invalida el build incremental
+    with open(csproj_path, "rb") as f:
+        if f.read().strip() == nuevo.strip():
+            return
+    with open(csproj_path, "wb") as f:
+        f.write(nuevo)
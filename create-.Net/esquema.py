@@ -0,0 +1,58 @@
+import re
+
+from manifiesto import leer_json_o_yaml
+
+# Esquema de entidades para generar el código de muchas a la vez, en JSON o YAML:
+#
+#   entidades:
+#     - nombre: Producto
+#       plural: Productos          # opcional, por defecto nombre + "s"
+#       campos:
+#         Nombre: string
+#         Precio: decimal
+#     - nombre: Cliente
+#       campos: {Nombre: string, Email: "string?", Alta: DateTime}
+#
+# En YAML los tipos anulables van entre comillas dentro de {...}: sin ellas el
+# "?" rompe el parseo del mapa en línea (en estilo de bloque no hace falta).
+# Cada entidad tiene un Id int implícito. Los tipos se copian tal cual al C#;
+# las propiedades string no anulables se inicializan con string.Empty.
+
+ENTIDADES_POR_DEFECTO = [
+    {"nombre": "Producto", "plural": "Productos", "campos": {"Nombre": "string", "Precio": "decimal"}},
+]
+
+_IDENTIFICADOR = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_TIPO = re.compile(r"[A-Za-z_][A-Za-z0-9_.<>, \[\]]*\??")
+
+
+def cargar_esquema(ruta):
+    datos = leer_json_o_yaml(ruta)
+    entidades = datos.get("entidades") if isinstance(datos, dict) else datos
+    if not entidades:
+        raise SystemExit(f"El esquema {ruta} no tiene entidades.")
+    return normalizar(entidades)
+
+
+def normalizar(entidades):
+    resultado, nombres = [], set()
+    for e in entidades:
+        nombre = e["nombre"]
+        plural = e.get("plural") or f"{nombre}s"
+        for ident in (nombre, plural):
+            if not _IDENTIFICADOR.fullmatch(ident):
+                raise SystemExit(f"'{ident}' no es un nombre de clase C# válido.")
+        if nombre in nombres:
+            raise SystemExit(f"Entidad repetida en el esquema: {nombre}")
+        nombres.add(nombre)
+
+        campos = e.get("campos") or {}
+        if isinstance(campos, list):
+            campos = {c["nombre"]: c["tipo"] for c in campos}
+        for campo, tipo in campos.items():
+            if not _IDENTIFICADOR.fullmatch(campo) or not _TIPO.fullmatch(str(tipo)):
+                raise SystemExit(f"Campo inválido en {nombre}: {campo}: {tipo}")
+            if campo == "Id":
+                raise SystemExit(f"{nombre}.Id es implícito, quítalo del esquema.")
+        resultado.append({"nombre": nombre, "plural": plural, "campos": {c: str(t) for c, t in campos.items()}})
+    return resultado
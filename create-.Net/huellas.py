@@ -0,0 +1,94 @@
+import json
+import threading
+from pathlib import Path
+
+from colores import print_error, print_info
+from arbol import escribir_arbol
+
+# Regeneración incremental de los archivos generados. En cada proyecto se guarda
+# MANIFIESTO con el sha256 de lo último que escribimos en cada archivo. Al
+# volver a generar:
+#   - si el contenido nuevo es igual al del disco no se toca (se conserva el
+#     mtime, así MSBuild y las capas de docker siguen en caché);
+#   - si el disco coincide con la huella guardada (nadie lo editó) se reescribe;
+#   - si el disco difiere de la huella el usuario lo editó: es un conflicto y
+#     se deja como está, salvo con forzar.
+# Los archivos sin huella (los que deja `dotnet new`) se reemplazan.
+
+MANIFIESTO = ".create-dotnet.json"
+
+_candados = {}
+_candado_global = threading.Lock()
+_forzar = False
+TOTALES = {"escritos": 0, "sin cambios": 0, "conflictos": 0}
+
+
+def configurar(forzar=False):
+    global _forzar
+    _forzar = forzar
+
+
+def huella(datos):
+    import hashlib  # diferido: _hashlib carga OpenSSL (~3 ms) y --plan no escribe nada
+    return hashlib.sha256(datos).hexdigest()
+
+
+def _candado(ruta):
+    with _candado_global:
+        return _candados.setdefault(ruta, threading.Lock())
+
+
+def _leer_manifiesto(ruta):
+    try:
+        return json.loads(ruta.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def escribir_generados(base_path, archivos, forzar=None, carpetas=()):
+    # archivos: {ruta relativa: texto}. Devuelve {"escritos", "sin cambios", "conflictos"} con las rutas.
+    # carpetas: directorios extra que deben existir (con .gitkeep si quedan vacíos)
+    base_path = Path(base_path)
+    forzar = _forzar if forzar is None else forzar
+    ruta_manifiesto = base_path / MANIFIESTO
+    resumen = {"escritos": [], "sin cambios": [], "conflictos": []}
+
+    # Varias tareas del grafo escriben en el mismo proyecto a la vez
+    with _candado(ruta_manifiesto.resolve()):
+        huellas = _leer_manifiesto(ruta_manifiesto)
+        previas = dict(huellas)
+        pendientes = {}
+        for relativo, texto in archivos.items():
+            clave = Path(relativo).as_posix()
+            datos = texto.encode("utf-8")
+            nueva = huella(datos)
+            try:
+                actual = huella((base_path / relativo).read_bytes())
+            except FileNotFoundError:
+                actual = None
+
+            if actual == nueva:
+                resumen["sin cambios"].append(clave)
+            elif actual is None or clave not in huellas or huellas[clave] == actual or forzar:
+                pendientes[relativo] = texto
+                resumen["escritos"].append(clave)
+            else:
+                resumen["conflictos"].append(clave)
+                continue
+            huellas[clave] = nueva
+
+        escribir_arbol(base_path, pendientes, carpetas)
+        if huellas != previas:
+            ruta_manifiesto.write_text(json.dumps(huellas, indent=2, sort_keys=True), encoding="utf-8")
+        for estado, rutas in resumen.items():
+            TOTALES[estado] += len(rutas)
+
+    for clave in resumen["conflictos"]:
+        print_error(f"Conflicto: {base_path / clave} fue editado a mano, no se sobrescribe (usa --forzar)")
+    return resumen
+
+
+def reporte_totales():
+    print_info("Archivos generados: "
+               f"{TOTALES['escritos']} escritos, {TOTALES['sin cambios']} sin cambios, "
+               f"{TOTALES['conflictos']} en conflicto")
@@ -0,0 +1,135 @@
+from itertools import product
+
+# Generador del Dockerfile de cada servicio. El contexto de build es la carpeta
+# de la solución (el Dockerfile copia <Proyecto>/<Proyecto>.csproj). Siempre
+# hay un único `dotnet publish` (sin build previo) y el .csproj se copia antes
+# que el código para que el restore quede en su propia capa.
+#
+# Opciones:
+#   cache_nuget    RUN --mount=type=cache para ~/.nuget/packages (BuildKit)
+#   base           debian | alpine | chiseled (imágenes de runtime de Microsoft)
+#   r2r            PublishReadyToRun: código precompilado, arranque más rápido
+#   pgo            TieredPGO explícito en el publish
+#   autocontenido  publica el runtime con la app y usa la imagen runtime-deps
+#   recortado      PublishTrimmed (implica autocontenido)
+#   invariante     InvariantGlobalization: sin ICU, imagen y memoria menores
+
+OPCIONES_DOCKER = {
+    "cache_nuget": True,
+    "base": "debian",
+    "r2r": False,
+    "pgo": True,
+    "autocontenido": False,
+    "recortado": False,
+    "invariante": False,
+}
+
+VERSION_DOTNET = "9.0"
+PUERTO = 8080
+
+# Va en la carpeta de la solución (contexto del build)
+DOCKERIGNORE = """**/bin/
+**/obj/
+**/.vs/
+**/.vscode/
+**/*.db
+**/.create-dotnet.json
+.git/
+"""
+
+# base: (etiqueta del SDK, etiqueta de runtime, RID)
+BASES = {
+    "debian": ("", "", "linux-x64"),
+    "alpine": ("-alpine", "-alpine", "linux-musl-x64"),
+    "chiseled": ("-noble", "-noble-chiseled", "linux-x64"),
+}
+
+_CACHE_NUGET = "--mount=type=cache,id=nuget,target=/root/.nuget/packages \\\n    "
+
+
+def normalizar_opciones(opciones=None):
+    opciones = {**OPCIONES_DOCKER, **(opciones or {})}
+    desconocidas = set(opciones) - set(OPCIONES_DOCKER)
+    if desconocidas:
+        raise ValueError(f"Opciones de Dockerfile desconocidas: {', '.join(sorted(desconocidas))}")
+    if opciones["base"] not in BASES:
+        raise ValueError(f"Base de imagen '{opciones['base']}' inválida, usa una de: {', '.join(BASES)}")
+    if opciones["recortado"]:
+        opciones["autocontenido"] = True
+    return opciones
+
+
+def combinaciones():
+    # Todas las combinaciones válidas de opciones, para revisar el generador
+    booleanas = [k for k, v in OPCIONES_DOCKER.items() if isinstance(v, bool)]
+    vistas = set()
+    for base in BASES:
+        for valores in product([False, True], repeat=len(booleanas)):
+            opciones = normalizar_opciones({"base": base, **dict(zip(booleanas, valores))})
+            clave = tuple(sorted(opciones.items()))
+            if clave not in vistas:
+                vistas.add(clave)
+                yield opciones
+
+
+def generar_dockerfile(proyecto, opciones=None):
+    o = normalizar_opciones(opciones)
+    sdk, runtime, rid = BASES[o["base"]]
+    con_rid = o["r2r"] or o["autocontenido"]
+    cache = _CACHE_NUGET if o["cache_nuget"] else ""
+    imagen_final = "runtime-deps" if o["autocontenido"] else "aspnet"
+
+    # El restore recibe las mismas propiedades que el publish: R2R, trimming y
+    # autocontenido necesitan sus paquetes (crossgen, ILLink, runtime packs)
+    # restaurados para que `publish --no-restore` funcione
+    propiedades = []
+    if con_rid:
+        propiedades += ["-r $RID", f"-p:SelfContained={'true' if o['autocontenido'] else 'false'}"]
+    if not o["autocontenido"]:
+        propiedades.append("-p:UseAppHost=false")
+    if o["r2r"]:
+        propiedades.append("-p:PublishReadyToRun=true")
+    if o["pgo"]:
+        propiedades.append("-p:TieredPGO=true")
+    if o["recortado"]:
+        propiedades.append("-p:PublishTrimmed=true")
+    if o["invariante"]:
+        propiedades.append("-p:InvariantGlobalization=true")
+    restore = [f'dotnet restore "{proyecto}/{proyecto}.csproj"'] + propiedades
+    publish = [f'dotnet publish "{proyecto}.csproj" -c Release -o /app/publish --no-restore'] + propiedades
+
+    activas = [k for k, v in o.items() if v is True]
+    lineas = [
+        "# syntax=docker/dockerfile:1",
+        f"# Generado por create-.Net (base {o['base']}{', ' + ', '.join(activas) if activas else ''})",
+        "# Build desde la carpeta de la solución: docker build -f "
+        f"{proyecto}/Dockerfile -t {proyecto.lower()} .",
+        "",
+        f"FROM mcr.microsoft.com/dotnet/sdk:{VERSION_DOTNET}{sdk} AS build",
+    ]
+    if con_rid:
+        lineas.append(f"ARG RID={rid}")
+    lineas += [
+        "WORKDIR /src",
+        f'COPY ["{proyecto}/{proyecto}.csproj", "{proyecto}/"]',
+        f"RUN {cache}" + " \\\n        ".join(restore),
+        "COPY . .",
+        f'WORKDIR "/src/{proyecto}"',
+        f"RUN {cache}" + " \\\n        ".join(publish),
+        "",
+        f"FROM mcr.microsoft.com/dotnet/{imagen_final}:{VERSION_DOTNET}{runtime} AS final",
+        "WORKDIR /app",
+        f"EXPOSE {PUERTO}",
+        f"ENV ASPNETCORE_ENVIRONMENT=Production \\\n    ASPNETCORE_HTTP_PORTS={PUERTO}",
+    ]
+    if o["invariante"]:
+        lineas[-1] += " \\\n    DOTNET_SYSTEM_GLOBALIZATION_INVARIANT=true"
+    lineas += [
+        "# La base SQLite no va en la imagen: móntala como volumen",
+        "COPY --from=build /app/publish .",
+    ]
+    if o["autocontenido"]:
+        lineas.append(f'ENTRYPOINT ["./{proyecto}"]')
+    else:
+        lineas.append(f'ENTRYPOINT ["dotnet", "{proyecto}.dll"]')
+    return "\n".join(lineas) + "\n"
@@ -1,20 +1,18 @@
 
 import argparse
 import os
-from pathlib import Path
-import sys
 from time import time
-import subprocess
 
 from colores import print_ok, print_info
-from comandos import ejecutar_comando
-from estructura import crear_carpetas, crear_archivos
-from configuracion import crear_nuevo_appsettings, crear_nuevo_launchsettings, dockerfile
-from dependencias import instalar_paquetes
+from constantes import LOG_POR_DEFECTO, PRESETS_ENTORNO
+from imagen_docker import BASES
 
-def main():
-    inicio = time()
+# Arriba solo va lo que necesita el parser: --help no paga comandos, el
+# ejecutor de tareas, el generador ni asyncio, ni recorre plantillas/perfiles.
+# Cada rama importa sus módulos al usarlos (ver benchmarks/bench_arranque.py)
+# y ningún módulo imprime al importarse.
 
+def crear_parser():
     parser = argparse.ArgumentParser(description="Crea entorno .NET completo con Swagger y lógica básica. & Crear nuevo launchSettings.json para el proyecto.")
     parser.add_argument('--sln', type=str, help='Nombre de la solución')
     parser.add_argument('--api', type=str, help='Nombre del proyecto Web API')
@@ -22,77 +20,149 @@ def main():
     parser.add_argument('--test', action='store_true', help='Crear proyecto de pruebas xUnit')
     parser.add_argument('--run', action='store_true', help='Levantar el servidor al finalizar')
     parser.add_argument("--puerto", type=int, help="Puerto para la aplicación")
-    args = parser.parse_args()
+    parser.add_argument("--paralelo", type=int, help="Máximo de pasos simultáneos (1 = secuencial; por defecto, los núcleos de la CPU)")
+    parser.add_argument("--manifiesto", type=str, help="JSON/YAML con la solución y los servicios a crear en lote")
+    parser.add_argument("--entidades", type=str, help="Esquema JSON/YAML con las entidades a generar (por defecto Producto)")
+    # Los perfiles válidos (carpetas de plantillas/perfiles) se comprueban después de parsear
+    parser.add_argument("--perfil", "--profile", default="base",
+                        help="Perfil de plantillas (base o una carpeta de plantillas/perfiles): perf = DbContext en "
+                             "pool, lecturas paginadas sin tracking, compresión, output cache, minimal API y script "
+                             "de carga k6")
+    parser.add_argument("--docker-base", choices=list(BASES), help="Imagen de runtime del Dockerfile")
+    parser.add_argument("--docker-r2r", action="store_true", help="Publicar con ReadyToRun")
+    parser.add_argument("--docker-autocontenido", action="store_true", help="Publicar autocontenido sobre runtime-deps")
+    parser.add_argument("--docker-recortado", action="store_true", help="Publicar recortado (PublishTrimmed, implica autocontenido)")
+    parser.add_argument("--docker-invariante", action="store_true", help="InvariantGlobalization (sin ICU)")
+    parser.add_argument("--docker-sin-cache", action="store_true", help="Sin RUN --mount=type=cache para NuGet")
+    parser.add_argument("--docker-sin-pgo", action="store_true", help="Sin TieredPGO explícito")
+    parser.add_argument("--forzar", action="store_true", help="Sobrescribir también los archivos generados que se editaron a mano")
+    parser.add_argument("--no-cache", action="store_true", help="Usar siempre `dotnet new` sin la caché de plantillas")
+    parser.add_argument("--calentar-cache", action="store_true", help="Generar la caché de plantillas y salir")
+    parser.add_argument("--entorno", choices=list(PRESETS_ENTORNO), default="rapido",
+                        help="Variables de entorno para el CLI de .NET (rapido = sin telemetría, logo ni primer uso)")
+    parser.add_argument("--sin-servidor-build", action="store_true",
+                        help="No reutilizar nodos de MSBuild ni el servidor de build entre pasos")
+    parser.add_argument("--apagar-servidor-build", action="store_true",
+                        help="Ejecutar `dotnet build-server shutdown` al terminar (agentes de CI)")
+    parser.add_argument("--plan", action="store_true", help="Mostrar la lista ordenada de acciones sin ejecutar nada")
+    parser.add_argument("--simular", action="store_true",
+                        help="Usar un dotnet simulado en proceso: genera el árbol de archivos en milisegundos sin el SDK")
+    parser.add_argument("--traza", nargs="?", const="create-dotnet-traza.json",
+                        help="Guardar los spans de tiempo en formato Chrome trace-event y mostrar la tabla resumen")
+    parser.add_argument("--log", type=str, default=LOG_POR_DEFECTO, help="Log rotativo con la salida de los comandos")
+    return parser
 
-    # Recoger los parámetros
-    sln = args.sln or input("Nombre de la solución: ")
-    api = args.api or input("Nombre del proyecto Web API: ")
 
-    base_path = Path(args.path).resolve()
+def main():
+    inicio = time()
+    parser = crear_parser()
+    args = parser.parse_args()
+    if args.perfil != "base":
+        from motor_plantillas import perfiles
+        if args.perfil not in perfiles():
+            parser.error(f"argument --perfil/--profile: invalid choice: '{args.perfil}' "
+                         f"(choose from {', '.join(map(repr, perfiles()))})")
+
+    from comandos import configurar_log, configurar_entorno
+
+    if not args.plan:
+        print_info(f"Salida de los comandos en {configurar_log(args.log)}")
+    configurar_entorno(args.entorno, servidor_build=not args.sin_servidor_build)
+    simulado = None
+    if args.simular:
+        from comandos import usar_backend
+        from simulador import DotnetSimulado
+        simulado = DotnetSimulado()
+        usar_backend(simulado)
+
+    if args.calentar_cache:
+        from cache_plantillas import calentar_todas
+        calentar_todas(forzar=True)
+        return
+    # El simulador no debe llenar la caché de plantillas con esqueletos falsos
+    usar_cache = not args.no_cache and not args.simular
+    from huellas import configurar as configurar_huellas, reporte_totales
+    from proyecto import construir_tareas
+    configurar_huellas(forzar=args.forzar)
+
+    if args.manifiesto:
+        # Varios servicios bajo una solución, con un solo restore al final
+        from manifiesto import cargar_manifiesto
+        manifiesto = cargar_manifiesto(args.manifiesto)
+        sln = manifiesto["solucion"]
+        servicios = manifiesto["servicios"]
+        ruta = manifiesto["path"] if args.path == "." else args.path
+        paralelo = args.paralelo or manifiesto["paralelo"]
+    else:
+        # Recoger los parámetros
+        sln = args.sln or input("Nombre de la solución: ")
+        api = args.api or input("Nombre del proyecto Web API: ")
+        # Un solo servicio sigue el mismo camino que un manifiesto de un servicio
+        from manifiesto import asignar_puertos
+        servicios = asignar_puertos([{"nombre": api, "puerto": args.puerto, "test": args.test}])
+        ruta = args.path
+        paralelo = args.paralelo
+
+    if args.entidades:
+        from esquema import cargar_esquema
+        entidades = cargar_esquema(args.entidades)
+        for servicio in servicios:
+            servicio["entidades"] = entidades
+    if args.perfil != "base":
+        for servicio in servicios:
+            servicio["perfil"] = args.perfil
+    docker = {clave: valor for clave, valor in {
+        "base": args.docker_base,
+        "r2r": args.docker_r2r or None,
+        "autocontenido": args.docker_autocontenido or None,
+        "recortado": args.docker_recortado or None,
+        "invariante": args.docker_invariante or None,
+        "cache_nuget": False if args.docker_sin_cache else None,
+        "pgo": False if args.docker_sin_pgo else None,
+    }.items() if valor is not None}
+    for servicio in servicios:
+        servicio["docker"] = {**servicio.get("docker", {}), **docker}
+
+    from pathlib import Path
+    base_path = Path(ruta).resolve()
+    if args.plan:
+        from tareas import imprimir_plan
+        imprimir_plan(construir_tareas(sln, base_path, servicios, usar_cache))
+        return
     if not base_path.exists():
         os.makedirs(base_path, exist_ok=True)
         print_ok(f"Created new directory: {base_path}")
     else:
         print_ok(f"Using existing directory: {base_path}")
 
-    # Crear la solución
-    ejecutar_comando(f"dotnet new sln -n {sln}", cwd=base_path)
-    ejecutar_comando(f"dotnet new webapi -n {api}", cwd=base_path)
-    ejecutar_comando(f"dotnet sln {sln}.sln add {api}/{api}.csproj", cwd=base_path)
-
-    # Crear carpetas necesarias
-    carpetas = ["Controllers", "Data", "Dto", "Entities", "Error", "Extensions", "Helpers", "Interfaces", "Middleware", "Repositories", "Tests"]
-    api_path = base_path / api
-    crear_carpetas(api_path, carpetas)
-
-    # Instalar paquetes de NuGet
-    instalar_paquetes(api_path)
-
-    # Crear los archivos necesarios (Entity, DTO, Context, Repository, etc.)
-    crear_archivos(api_path, api)
+    # Pasos del scaffolding como grafo: cada tarea arranca en cuanto terminan sus dependencias
+    # (la traza se guarda también si un paso falla)
+    from tareas import ejecutar_grafo
+    from trazas import exportar_chrome, reporte as reporte_trazas
+    try:
+        ejecutar_grafo(construir_tareas(sln, base_path, servicios, usar_cache), paralelo)
+    finally:
+        if args.traza:
+            reporte_trazas()
+            print_info(f"Traza Chrome (chrome://tracing o ui.perfetto.dev): {exportar_chrome(args.traza)}")
+    reporte_totales()
+    if args.apagar_servidor_build:
+        from comandos import apagar_servidor_build
+        apagar_servidor_build()
+    if simulado:
+        print_info(f"Backend simulado: {len(simulado.registro)} comandos dotnet registrados, ninguno ejecutado")
 
-    # Crear proyecto de pruebas si se indica
-    if args.test:
-        test_name = f"{api}.Tests"
-        ejecutar_comando(f"dotnet new xunit -n {test_name}", cwd=base_path)
-        ejecutar_comando(f"dotnet sln {sln}.sln add {test_name}/{test_name}.csproj", cwd=base_path)
-        print_ok(f"Proyecto de pruebas creado: {test_name}")
-
-
-
-
-
-    # Actualizar archivos de configuración
-    crear_nuevo_appsettings(api_path)
-    crear_nuevo_launchsettings(api_path,args.puerto) 
-
-    # Crear Dockerfile
-    dockerfile(api_path)
-
-    # Construir el path completo a la API
-    path_migration = os.path.join(args.path, args.api)
-
-    # Verifica que la ruta exista
-    if not os.path.exists(path_migration):
-        print_info(f"La ruta {path_migration} no existe. Verifica el path.")
-        sys.exit(1)
-    else:
-        print_ok(f"Ruta encontrada: {path_migration}")
-        
-        
-    ejecutar_comando("dotnet ef migrations add NombreDeLaMigracion", cwd=path_migration)
-    ejecutar_comando("dotnet ef database update", cwd=path_migration)
-    
-    
     # Calcular y mostrar duración
     duracion = round(time() - inicio, 2)
     print_ok(f"\n🎉 Proyecto .NET completo listo en {duracion}s.")
-    print_info(f"Swagger: http://localhost:{args.puerto}/index.html")
+    for servicio in servicios:
+        print_info(f"Swagger {servicio['nombre']}: http://localhost:{servicio['puerto']}/index.html")
 
     # Levantar el servidor si se indica
-    if args.run:
+    if args.run and not args.manifiesto:
         print_info("Levantando servidor...")
-        ejecutar_comando("dotnet run --open", cwd=api_path)
+        from comandos import ejecutar_comando
+        ejecutar_comando(["dotnet", "run", "--open"], cwd=base_path / api)
         print_ok("Servidor levantado exitosamente")
 
 
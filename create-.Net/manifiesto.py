@@ -0,0 +1,101 @@
+import json
+from pathlib import Path
+
+# Manifiesto para crear varios servicios bajo una misma solución, en JSON o YAML:
+#
+#   solucion: Plataforma
+#   path: ./plataforma
+#   puerto_base: 5000
+#   paralelo: 4
+#   servicios:
+#     - nombre: Pedidos
+#       puerto: 5100
+#       test: true
+#       entidades: pedidos.yaml   # esquema de entidades (ver esquema.py)
+#       perfil: perf              # plantillas/perfiles/perf (ver motor_plantillas.py)
+#       docker: {base: alpine, r2r: true}   # opciones de imagen_docker.py
+#     - nombre: Clientes
+#
+# Los servicios sin puerto reciben uno libre a partir de puerto_base. Cada
+# servicio ocupa su puerto y puerto + 1000 (perfiles https/http de
+# launchSettings.json), así que la asignación evita ambos.
+
+def leer_json_o_yaml(ruta):
+    ruta = Path(ruta)
+    texto = ruta.read_text(encoding="utf-8")
+    if ruta.suffix.lower() in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise SystemExit(f"Para leer {ruta.name} instala PyYAML (pip install pyyaml) o usa JSON.")
+        try:
+            return yaml.safe_load(texto)
+        except yaml.YAMLError as exc:
+            raise SystemExit(f"{ruta} no es YAML válido: {exc}")
+    try:
+        return json.loads(texto)
+    except json.JSONDecodeError as exc:
+        raise SystemExit(f"{ruta} no es JSON válido: {exc}")
+
+
+def cargar_manifiesto(ruta):
+    ruta = Path(ruta)
+    datos = leer_json_o_yaml(ruta)
+
+    if not datos.get("solucion") or not datos.get("servicios"):
+        raise SystemExit(f"El manifiesto {ruta} debe tener 'solucion' y al menos un elemento en 'servicios'.")
+
+    servicios = []
+    for s in datos["servicios"]:
+        if isinstance(s, str):
+            s = {"nombre": s}
+        servicios.append({
+            "nombre": s["nombre"],
+            "puerto": s.get("puerto"),
+            "test": bool(s.get("test", datos.get("test", False))),
+            "migraciones": bool(s.get("migraciones", datos.get("migraciones", True))),
+            "entidades": _esquema(ruta, s.get("entidades", datos.get("entidades"))),
+            "perfil": s.get("perfil", datos.get("perfil", "base")),
+            "docker": {**datos.get("docker", {}), **s.get("docker", {})},
+        })
+    nombres = [s["nombre"] for s in servicios]
+    repetidos = {n for n in nombres if nombres.count(n) > 1}
+    if repetidos:
+        raise SystemExit(f"Servicios repetidos en el manifiesto: {', '.join(sorted(repetidos))}")
+
+    asignar_puertos(servicios, datos.get("puerto_base", 5000))
+    return {
+        "solucion": datos["solucion"],
+        "path": datos.get("path", "."),
+        "paralelo": datos.get("paralelo"),
+        "servicios": servicios,
+    }
+
+
+def _esquema(ruta_manifiesto, esquema):
+    # Ruta a un esquema de entidades (relativa al manifiesto) o la lista en línea.
+    # Import local porque esquema importa leer_json_o_yaml de este módulo
+    from esquema import cargar_esquema, normalizar
+    if not esquema:
+        return None
+    if isinstance(esquema, list):
+        return normalizar(esquema)
+    return cargar_esquema(Path(ruta_manifiesto).parent / esquema)
+
+
+def asignar_puertos(servicios, puerto_base=5000, separacion=1000):
+    usados = set()
+    for s in servicios:
+        if s["puerto"] is not None:
+            par = {s["puerto"], s["puerto"] + separacion}
+            if par & usados:
+                raise SystemExit(f"El puerto {s['puerto']} de '{s['nombre']}' choca con otro servicio.")
+            usados |= par
+    candidato = puerto_base
+    for s in servicios:
+        if s["puerto"] is None:
+            while candidato in usados or candidato + separacion in usados:
+                candidato += 1
+            s["puerto"] = candidato
+            usados |= {candidato, candidato + separacion}
+    return servicios
@@ -0,0 +1,123 @@
+import os
+import re
+from functools import lru_cache
+from itertools import repeat
+from pathlib import Path
+
+# Motor de plantillas mínimo para el código C# generado. Las plantillas viven
+# como archivos en plantillas/<conjunto>/ y reproducen el árbol del proyecto:
+# la ruta y el contenido de cada *.tpl pueden llevar marcadores {{nombre}}.
+# Solo {{identificador}} es un marcador, el resto de llaves se copia tal cual,
+# así el C# se escribe sin escapar nada. Cada plantilla se parsea una vez y se
+# compila a un str.format_map (memoizado por ruta).
+#
+# Para agregar un archivo al proyecto generado basta con crear otro .tpl.
+#
+# Los perfiles (plantillas/perfiles/<perfil>/<conjunto>/) se superponen al
+# conjunto base: un .tpl con la misma ruta reemplaza al base, uno nuevo se
+# agrega y uno vacío (0 bytes) quita ese archivo del proyecto generado.
+
+DIR_PLANTILLAS = Path(__file__).resolve().parent / "plantillas"
+DIR_PERFILES = DIR_PLANTILLAS / "perfiles"
+EXTENSION = ".tpl"
+# Por debajo de este número de contextos arrancar procesos cuesta más que renderizar
+UMBRAL_PROCESOS = 2000
+
+_MARCADOR = re.compile(r"\{\{\s*([A-Za-z_]\w*)\s*\}\}")
+
+
+def compilar(texto, nombre="<plantilla>"):
+    # Convierte la plantilla en una cadena de formato: las llaves literales se
+    # duplican y cada marcador queda como {clave}
+    partes = []
+    fin = 0
+    for m in _MARCADOR.finditer(texto):
+        partes.append(texto[fin:m.start()].replace("{", "{{").replace("}", "}}"))
+        partes.append("{" + m.group(1) + "}")
+        fin = m.end()
+    partes.append(texto[fin:].replace("{", "{{").replace("}", "}}"))
+    formato = "".join(partes)
+
+    def renderizar(contexto):
+        try:
+            return formato.format_map(contexto)
+        except KeyError as exc:
+            raise KeyError(f"La plantilla {nombre} usa {{{{{exc.args[0]}}}}} y no está en el contexto") from None
+
+    return renderizar
+
+
+@lru_cache(maxsize=None)
+def cargar(ruta):
+    ruta = Path(ruta)
+    return compilar(ruta.read_text(encoding="utf-8"), ruta.name)
+
+
+def renderizar(relativo, contexto):
+    # Una plantilla suelta, p. ej. renderizar("config/appsettings.json", {...})
+    return cargar(DIR_PLANTILLAS / f"{relativo}{EXTENSION}")(contexto)
+
+
+def perfiles():
+    return ["base"] + sorted(p.name for p in DIR_PERFILES.iterdir() if p.is_dir())
+
+
+def _capas(nombre, perfil):
+    if perfil in (None, "base"):
+        return [DIR_PLANTILLAS / nombre]
+    if not (DIR_PERFILES / perfil).is_dir():
+        raise FileNotFoundError(f"No existe el perfil de plantillas '{perfil}' en {DIR_PERFILES}")
+    return [DIR_PLANTILLAS / nombre, DIR_PERFILES / perfil / nombre]
+
+
+@lru_cache(maxsize=None)
+def conjunto(nombre, perfil=None):
+    # [(ruta relativa compilada, contenido compilado)] de un conjunto de plantillas
+    capas = _capas(nombre, perfil)
+    if not capas[0].is_dir():
+        raise FileNotFoundError(f"No existe el conjunto de plantillas '{nombre}' en {DIR_PLANTILLAS}")
+    rutas = {}
+    for base in capas:
+        for ruta in base.rglob(f"*{EXTENSION}"):
+            rutas[ruta.relative_to(base).as_posix()[:-len(EXTENSION)]] = ruta
+    return tuple(
+        (compilar(relativo, relativo), cargar(ruta))
+        for relativo, ruta in sorted(rutas.items())
+        if ruta.stat().st_size
+    )
+
+
+def renderizar_conjunto(nombre, contexto, perfil=None):
+    # Genera {ruta relativa: texto} en memoria, sin tocar disco
+    return {Path(ruta(contexto)): contenido(contexto) for ruta, contenido in conjunto(nombre, perfil)}
+
+
+def fragmento(nombre, contexto, perfil=None):
+    # Plantillas de una línea (plantillas/fragmentos) que se repiten dentro de otras
+    for capa in reversed(_capas("fragmentos", perfil)):
+        ruta = capa / f"{nombre}{EXTENSION}"
+        if ruta.exists():
+            return cargar(ruta)(contexto).rstrip("\n")
+    raise FileNotFoundError(f"No existe el fragmento '{nombre}'")
+
+
+def _renderizar_bloque(nombre, contextos, perfil=None):
+    return [renderizar_conjunto(nombre, c, perfil) for c in contextos]
+
+
+def renderizar_lote(nombre, contextos, procesos=None, perfil=None):
+    # Renderiza un conjunto para muchos contextos (p. ej. una vez por entidad).
+    # Con procesos > 1 los contextos se reparten en bloques entre procesos; por
+    # defecto solo se usan cuando el lote supera UMBRAL_PROCESOS.
+    contextos = list(contextos)
+    if procesos is None:
+        procesos = os.cpu_count() or 1 if len(contextos) >= UMBRAL_PROCESOS else 1
+    procesos = min(procesos, len(contextos))
+    if procesos <= 1:
+        return _renderizar_bloque(nombre, contextos, perfil)
+    from concurrent.futures import ProcessPoolExecutor  # solo se paga al repartir entre procesos
+    tam = -(-len(contextos) // procesos)
+    bloques = [contextos[i:i + tam] for i in range(0, len(contextos), tam)]
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        return [archivos for bloque in pool.map(_renderizar_bloque, repeat(nombre), bloques, repeat(perfil)) for archivos in bloque]
+
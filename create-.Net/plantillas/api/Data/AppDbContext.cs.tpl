@@ -0,0 +1,11 @@
+using Microsoft.EntityFrameworkCore;
+using {{proyecto}}.Entities;
+
+namespace {{proyecto}}.Data
+{
+    public class AppDbContext : DbContext
+    {
+        public AppDbContext(DbContextOptions<AppDbContext> options) : base(options) { }
+{{dbsets}}
+    }
+}
@@ -0,0 +1,10 @@
+namespace {{proyecto}}.Helpers
+{
+    public static class FormatoHelper
+    {
+        public static string FormatearMoneda(decimal valor)
+        {
+            return $"${valor:N2}";
+        }
+    }
+}
@@ -0,0 +1,66 @@
+using {{proyecto}}.Interfaces;
+using Microsoft.OpenApi.Models;
+using {{proyecto}}.Repositories;
+using {{proyecto}}.Data;
+using Microsoft.EntityFrameworkCore;
+
+var builder = WebApplication.CreateBuilder(args);
+
+// Configuración de servicios
+// Configurar OpenAPI/Swagger
+builder.Services.AddSwaggerGen(c =>
+{
+    c.SwaggerDoc("v1", new OpenApiInfo
+    {
+        Title = "Mi API",
+        Version = "v1",
+        Description = "Ejemplo de API con Swagger en ASP.NET Core"
+    });
+});
+
+// Agregar DbContext para SQLite
+builder.Services.AddDbContext<AppDbContext>(options =>
+    options.UseSqlite(builder.Configuration.GetConnectionString("DefaultConnection")));
+
+// Registrar los servicios de repositorio
+{{repositorios}}
+
+// Agregar controladores
+builder.Services.AddControllers();
+
+// Habilitar CORS (si necesitas permitir solicitudes desde otros dominios)
+builder.Services.AddCors(options =>
+{
+    options.AddPolicy("AllowAll", builder =>
+        builder.AllowAnyOrigin()
+            .AllowAnyMethod()
+            .AllowAnyHeader());
+});
+
+var app = builder.Build();
+
+// Habilitar Swagger en desarrollo
+if (app.Environment.IsDevelopment())
+{
+    app.UseSwagger();
+    app.UseSwaggerUI(c =>
+    {
+        c.SwaggerEndpoint("/swagger/v1/swagger.json", "Mi API v1");
+        c.RoutePrefix = string.Empty; // Hace que Swagger esté disponible en la raíz
+    });
+}
+
+// Configuración de CORS (si es necesario)
+app.UseCors("AllowAll");
+
+// Habilitar redirección HTTPS (comentarlo si no estás usando HTTPS en desarrollo)
+app.UseHttpsRedirection();
+
+// Configurar las rutas de la aplicación
+app.UseRouting();
+
+// Mapeo de controladores
+app.MapControllers();
+
+// Iniciar la aplicación
+app.Run();
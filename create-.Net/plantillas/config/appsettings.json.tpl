@@ -0,0 +1,17 @@
+{
+  "Logging": {
+    "LogLevel": {
+      "Default": "Information",
+      "Microsoft.AspNetCore": "Warning"
+    }
+  },
+  "AllowedHosts": "*",
+  "ConnectionStrings": {
+    "DefaultConnection": "Data source=dating.db"
+  },
+  "JwtSettings": {
+    "SecretKey": "mi_clave_secreta_de_32_caracteres_12345",
+    "Issuer": "TuAPI",
+    "Audience": "TuCliente"
+  }
+}
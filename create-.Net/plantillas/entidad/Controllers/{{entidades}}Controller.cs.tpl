@@ -0,0 +1,25 @@
+using Microsoft.AspNetCore.Mvc;
+using {{proyecto}}.Entities;
+using {{proyecto}}.Interfaces;
+
+namespace {{proyecto}}.Controllers
+{
+    [ApiController]
+    [Route("api/[controller]")]
+    public class {{entidades}}Controller : ControllerBase
+    {
+        private readonly I{{entidad}}Repository _repo;
+
+        public {{entidades}}Controller(I{{entidad}}Repository repo)
+        {
+            _repo = repo;
+        }
+
+        [HttpGet]
+        public async Task<ActionResult<IEnumerable<{{entidad}}>>> Get{{entidades}}()
+        {
+            var {{entidades_var}} = await _repo.ObtenerTodosAsync();
+            return Ok({{entidades_var}});
+        }
+    }
+}
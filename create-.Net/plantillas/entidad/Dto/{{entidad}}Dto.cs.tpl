@@ -0,0 +1,7 @@
+namespace {{proyecto}}.Dto
+{
+    public class {{entidad}}Dto
+    {
+{{propiedades}}
+    }
+}
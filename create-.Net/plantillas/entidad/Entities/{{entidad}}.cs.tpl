@@ -0,0 +1,8 @@
+namespace {{proyecto}}.Entities
+{
+    public class {{entidad}}
+    {
+        public int Id { get; set; }
+{{propiedades}}
+    }
+}
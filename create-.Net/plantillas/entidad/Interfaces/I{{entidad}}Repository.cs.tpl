@@ -0,0 +1,9 @@
+using {{proyecto}}.Entities;
+
+namespace {{proyecto}}.Interfaces
+{
+    public interface I{{entidad}}Repository
+    {
+        Task<IEnumerable<{{entidad}}>> ObtenerTodosAsync();
+    }
+}
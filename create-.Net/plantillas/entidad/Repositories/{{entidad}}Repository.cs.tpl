@@ -0,0 +1,22 @@
+using {{proyecto}}.Data;
+using {{proyecto}}.Entities;
+using {{proyecto}}.Interfaces;
+using Microsoft.EntityFrameworkCore;
+
+namespace {{proyecto}}.Repositories
+{
+    public class {{entidad}}Repository : I{{entidad}}Repository
+    {
+        private readonly AppDbContext _context;
+
+        public {{entidad}}Repository(AppDbContext context)
+        {
+            _context = context;
+        }
+
+        public async Task<IEnumerable<{{entidad}}>> ObtenerTodosAsync()
+        {
+            return await _context.{{entidades}}.ToListAsync();
+        }
+    }
+}
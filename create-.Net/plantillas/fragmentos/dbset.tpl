@@ -0,0 +1 @@
+        public DbSet<{{entidad}}> {{entidades}} { get; set; }
@@ -0,0 +1 @@
+app.Map{{entidades}}Endpoints();
@@ -0,0 +1 @@
+        public {{tipo}} {{campo}} { get; set; }{{inicial}}
@@ -0,0 +1 @@
+builder.Services.AddScoped<I{{entidad}}Repository, {{entidad}}Repository>();
@@ -0,0 +1,79 @@
+using System.IO.Compression;
+using {{proyecto}}.Data;
+using {{proyecto}}.Endpoints;
+using {{proyecto}}.Interfaces;
+using {{proyecto}}.Repositories;
+using Microsoft.AspNetCore.ResponseCompression;
+using Microsoft.EntityFrameworkCore;
+using Microsoft.OpenApi.Models;
+
+var builder = WebApplication.CreateBuilder(args);
+
+// Configurar OpenAPI/Swagger
+builder.Services.AddEndpointsApiExplorer();
+builder.Services.AddSwaggerGen(c =>
+{
+    c.SwaggerDoc("v1", new OpenApiInfo
+    {
+        Title = "Mi API",
+        Version = "v1",
+        Description = "Ejemplo de API con Swagger en ASP.NET Core (perfil perf)"
+    });
+});
+
+// DbContext en pool (reutiliza instancias) y consultas sin tracking por defecto
+builder.Services.AddDbContextPool<AppDbContext>(options =>
+    options.UseSqlite(builder.Configuration.GetConnectionString("DefaultConnection"))
+        .UseQueryTrackingBehavior(QueryTrackingBehavior.NoTracking));
+
+// Registrar los servicios de repositorio
+{{repositorios}}
+
+// Compresión de respuestas (Brotli y Gzip en nivel rápido)
+builder.Services.AddResponseCompression(options =>
+{
+    options.EnableForHttps = true;
+    options.Providers.Add<BrotliCompressionProvider>();
+    options.Providers.Add<GzipCompressionProvider>();
+});
+builder.Services.Configure<BrotliCompressionProviderOptions>(options => options.Level = CompressionLevel.Fastest);
+builder.Services.Configure<GzipCompressionProviderOptions>(options => options.Level = CompressionLevel.Fastest);
+
+// Caché de salida para los GET
+builder.Services.AddOutputCache(options =>
+{
+    options.AddBasePolicy(policy => policy.Expire(TimeSpan.FromSeconds(10)));
+});
+
+// Habilitar CORS (si necesitas permitir solicitudes desde otros dominios)
+builder.Services.AddCors(options =>
+{
+    options.AddPolicy("AllowAll", builder =>
+        builder.AllowAnyOrigin()
+            .AllowAnyMethod()
+            .AllowAnyHeader());
+});
+
+var app = builder.Build();
+
+app.UseResponseCompression();
+
+// Habilitar Swagger en desarrollo
+if (app.Environment.IsDevelopment())
+{
+    app.UseSwagger();
+    app.UseSwaggerUI(c =>
+    {
+        c.SwaggerEndpoint("/swagger/v1/swagger.json", "Mi API v1");
+        c.RoutePrefix = string.Empty; // Hace que Swagger esté disponible en la raíz
+    });
+}
+
+app.UseHttpsRedirection();
+app.UseCors("AllowAll");
+app.UseOutputCache();
+
+// Endpoints de minimal API
+{{endpoints}}
+
+app.Run();
@@ -0,0 +1,36 @@
+// Prueba de carga de los GET paginados generados.
+//   k6 run -e BASE_URL=http://localhost:{{puerto}} carga/k6.js
+// Equivalente rápido con bombardier:
+//   bombardier -c 64 -d 30s -H "Accept-Encoding: br" "http://localhost:{{puerto}}/api/<Entidades>?take=50"
+import http from 'k6/http';
+import { check } from 'k6';
+
+const BASE_URL = __ENV.BASE_URL || 'http://localhost:{{puerto}}';
+const RUTAS = [
+{{rutas_k6}}
+];
+
+export const options = {
+  scenarios: {
+    constante: {
+      executor: 'constant-arrival-rate',
+      rate: Number(__ENV.RPS || 500),
+      timeUnit: '1s',
+      duration: __ENV.DURACION || '30s',
+      preAllocatedVUs: 50,
+      maxVUs: 200,
+    },
+  },
+  thresholds: {
+    http_req_failed: ['rate<0.01'],
+    http_req_duration: ['p(95)<50', 'p(99)<150'],
+  },
+};
+
+export default function () {
+  const ruta = RUTAS[Math.floor(Math.random() * RUTAS.length)];
+  const res = http.get(`${BASE_URL}${ruta}?skip=0&take=50`, {
+    headers: { 'Accept-Encoding': 'br, gzip' },
+  });
+  check(res, { 'status 200': (r) => r.status === 200 });
+}
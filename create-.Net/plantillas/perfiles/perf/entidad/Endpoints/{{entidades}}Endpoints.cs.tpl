@@ -0,0 +1,20 @@
+using {{proyecto}}.Interfaces;
+
+namespace {{proyecto}}.Endpoints
+{
+    public static class {{entidades}}Endpoints
+    {
+        private const int TamanoMaximo = 200;
+
+        // Minimal API en lugar del controlador: sin el pipeline de filtros de MVC
+        public static IEndpointRouteBuilder Map{{entidades}}Endpoints(this IEndpointRouteBuilder app)
+        {
+            app.MapGet("/api/{{entidades}}", async (I{{entidad}}Repository repo, CancellationToken ct, int skip = 0, int take = 50) =>
+                    TypedResults.Ok(await repo.ObtenerTodosAsync(Math.Max(skip, 0), Math.Clamp(take, 1, TamanoMaximo), ct)))
+                .CacheOutput()
+                .WithName("Get{{entidades}}")
+                .WithTags("{{entidades}}");
+            return app;
+        }
+    }
+}
@@ -0,0 +1,9 @@
+using {{proyecto}}.Entities;
+
+namespace {{proyecto}}.Interfaces
+{
+    public interface I{{entidad}}Repository
+    {
+        Task<IReadOnlyList<{{entidad}}>> ObtenerTodosAsync(int skip, int take, CancellationToken ct = default);
+    }
+}
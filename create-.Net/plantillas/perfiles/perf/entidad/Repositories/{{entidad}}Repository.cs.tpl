@@ -0,0 +1,28 @@
+using {{proyecto}}.Data;
+using {{proyecto}}.Entities;
+using {{proyecto}}.Interfaces;
+using Microsoft.EntityFrameworkCore;
+
+namespace {{proyecto}}.Repositories
+{
+    public class {{entidad}}Repository : I{{entidad}}Repository
+    {
+        private readonly AppDbContext _context;
+
+        public {{entidad}}Repository(AppDbContext context)
+        {
+            _context = context;
+        }
+
+        // Lectura sin tracking y paginada: no carga la tabla completa en memoria
+        public async Task<IReadOnlyList<{{entidad}}>> ObtenerTodosAsync(int skip, int take, CancellationToken ct = default)
+        {
+            return await _context.{{entidades}}
+                .AsNoTracking()
+                .OrderBy(e => e.Id)
+                .Skip(skip)
+                .Take(take)
+                .ToListAsync(ct);
+        }
+    }
+}
@@ -0,0 +1,69 @@
+from cache_plantillas import dotnet_new
+from configuracion import crear_nuevo_appsettings, crear_nuevo_launchsettings, dockerfile
+from dependencias import PAQUETES, escribir_paquetes
+from estructura import crear_archivos
+from tareas import Tarea
+
+CARPETAS = ["Controllers", "Data", "Dto", "Entities", "Error", "Extensions", "Helpers", "Interfaces", "Middleware", "Repositories", "Tests"]
+
+# Arma el grafo de tareas para una solución con uno o varios servicios.
+# servicios: lista de dicts {"nombre", "puerto", "test", "migraciones", "entidades", "perfil", "docker"}.
+# Los `dotnet sln add` van encadenados porque todos editan el mismo .sln y hay
+# un solo `dotnet restore` de la solución cuando todos los proyectos están
+# agregados; las migraciones de cada servicio esperan a ese restore.
+def construir_tareas(sln, base_path, servicios, usar_cache=True):
+    cache = " (desde la caché de plantillas)" if usar_cache else ""
+    tareas = [Tarea("sln", lambda: dotnet_new("sln", sln, base_path, usar_cache=usar_cache),
+                    descripcion=f"dotnet new sln -n {sln}{cache}")]
+    ultimo_sln = "sln"
+    despues_restore = []
+
+    for servicio in servicios:
+        api = servicio["nombre"]
+        api_path = base_path / api
+        p = f"{api}: " if len(servicios) > 1 else ""
+
+        tareas += [
+            Tarea(f"{p}webapi", lambda api=api: dotnet_new("webapi", api, base_path, usar_cache=usar_cache),
+                  descripcion=f"dotnet new webapi -n {api}{cache}"),
+            # Código generado y carpetas del proyecto en una sola escritura del árbol
+            Tarea(f"{p}archivos", lambda ruta=api_path, api=api, entidades=servicio.get("entidades"), perfil=servicio.get("perfil"),
+                  puerto=servicio["puerto"]: crear_archivos(ruta, api, entidades, perfil=perfil, carpetas=CARPETAS, puerto=puerto),
+                  [f"{p}webapi"],
+                  descripcion=f"crear_archivos {api} ({len(servicio.get('entidades') or [None])} entidades, "
+                              f"perfil {servicio.get('perfil') or 'base'}) + {api}/{{{','.join(CARPETAS)}}}"),
+            Tarea(f"{p}appsettings", lambda ruta=api_path: crear_nuevo_appsettings(ruta), [f"{p}webapi"],
+                  descripcion=f"escribir {api}/appsettings.json"),
+            Tarea(f"{p}launchsettings", lambda ruta=api_path, puerto=servicio["puerto"]: crear_nuevo_launchsettings(ruta, puerto),
+                  [f"{p}webapi"], descripcion=f"escribir {api}/Properties/launchSettings.json (puerto {servicio['puerto']})"),
+            Tarea(f"{p}dockerfile", lambda ruta=api_path, opciones=servicio.get("docker"): dockerfile(ruta, opciones),
+                  [f"{p}webapi"], descripcion=f"escribir {api}/Dockerfile y .dockerignore"),
+            # Todas las referencias NuGet en una sola edición del .csproj
+            Tarea(f"{p}paquetes", lambda csproj=api_path / f"{api}.csproj": escribir_paquetes(csproj), [f"{p}webapi"],
+                  descripcion=f"escribir {len(PAQUETES)} PackageReference en {api}/{api}.csproj"),
+            Tarea(f"{p}sln add api", ["dotnet", "sln", f"{sln}.sln", "add", f"{api}/{api}.csproj"],
+                  [ultimo_sln, f"{p}paquetes"], cwd=base_path),
+        ]
+        ultimo_sln = f"{p}sln add api"
+
+        # Crear proyecto de pruebas si se indica
+        if servicio.get("test"):
+            test_name = f"{api}.Tests"
+            tareas += [
+                Tarea(f"{p}xunit", lambda nombre=test_name: dotnet_new("xunit", nombre, base_path, usar_cache=usar_cache),
+                      descripcion=f"dotnet new xunit -n {test_name}{cache}"),
+                Tarea(f"{p}sln add tests", ["dotnet", "sln", f"{sln}.sln", "add", f"{test_name}/{test_name}.csproj"],
+                      [f"{p}xunit", ultimo_sln], cwd=base_path),
+            ]
+            ultimo_sln = f"{p}sln add tests"
+
+        # Las migraciones compilan el proyecto: necesitan paquetes, código y configuración
+        if servicio.get("migraciones", True):
+            despues_restore += [
+                Tarea(f"{p}migracion", ["dotnet", "ef", "migrations", "add", "NombreDeLaMigracion"],
+                      ["restore", f"{p}archivos", f"{p}appsettings", f"{p}launchsettings"], cwd=api_path),
+                Tarea(f"{p}database update", ["dotnet", "ef", "database", "update"], [f"{p}migracion"], cwd=api_path),
+            ]
+
+    tareas.append(Tarea("restore", ["dotnet", "restore", f"{sln}.sln"], [ultimo_sln], cwd=base_path))
+    return tareas + despues_restore
@@ -0,0 +1,200 @@
+import shlex
+import threading
+import uuid
+from pathlib import Path
+
+from dependencias import escribir_paquetes
+
+# Backend de comandos simulado (ver comandos.usar_backend). No lanza procesos:
+# registra cada comando y reproduce en milisegundos el árbol de archivos que
+# dejaría el CLI de .NET para lo que usa el scaffolding:
+#   dotnet new sln|webapi|xunit -n <nombre> [-o <dir>]
+#   dotnet sln <x>.sln add <proyecto>.csproj
+#   dotnet add [<proyecto>] package <paquete> [--version <v>]
+# restore, ef, build, run, --version y build-server se aceptan sin efecto.
+# Cualquier otro comando falla con 127, como un ejecutable inexistente.
+
+VERSION_SDK = "9.0.100-simulado"
+_TIPO_PROYECTO = "FAE04EC0-301F-11D3-BF4B-00C04F79EFBC"
+
+_CSPROJ_WEB = """<Project Sdk="Microsoft.NET.Sdk.Web">
+
+  <PropertyGroup>
+    <TargetFramework>net9.0</TargetFramework>
+    <Nullable>enable</Nullable>
+    <ImplicitUsings>enable</ImplicitUsings>
+  </PropertyGroup>
+
+  <ItemGroup>
+    <PackageReference Include="Microsoft.AspNetCore.OpenApi" Version="9.0.0" />
+  </ItemGroup>
+
+</Project>
+"""
+
+_CSPROJ_XUNIT = """<Project Sdk="Microsoft.NET.Sdk">
+
+  <PropertyGroup>
+    <TargetFramework>net9.0</TargetFramework>
+    <ImplicitUsings>enable</ImplicitUsings>
+    <Nullable>enable</Nullable>
+    <IsPackable>false</IsPackable>
+  </PropertyGroup>
+
+  <ItemGroup>
+    <PackageReference Include="coverlet.collector" Version="6.0.2" />
+    <PackageReference Include="Microsoft.NET.Test.Sdk" Version="17.12.0" />
+    <PackageReference Include="xunit" Version="2.9.2" />
+    <PackageReference Include="xunit.runner.visualstudio" Version="2.8.2" />
+  </ItemGroup>
+
+  <ItemGroup>
+    <Using Include="Xunit" />
+  </ItemGroup>
+
+</Project>
+"""
+
+_SLN = """
+Microsoft Visual Studio Solution File, Format Version 12.00
+# Visual Studio Version 17
+VisualStudioVersion = 17.0.31903.59
+MinimumVisualStudioVersion = 10.0.40219.1
+Global
+	GlobalSection(SolutionConfigurationPlatforms) = preSolution
+		Debug|Any CPU = Debug|Any CPU
+		Release|Any CPU = Release|Any CPU
+	EndGlobalSection
+EndGlobal
+"""
+
+_APPSETTINGS = """{
+  "Logging": {
+    "LogLevel": {
+      "Default": "Information",
+      "Microsoft.AspNetCore": "Warning"
+    }
+  },
+  "AllowedHosts": "*"
+}
+"""
+
+
+def _webapi(nombre):
+    return {
+        f"{nombre}.csproj": _CSPROJ_WEB,
+        f"{nombre}.http": f"@{nombre}_HostAddress = http://localhost:5000\n\nGET {{{{{nombre}_HostAddress}}}}/weatherforecast/\n",
+        "Program.cs": "var builder = WebApplication.CreateBuilder(args);\nbuilder.Services.AddOpenApi();\n"
+                      "var app = builder.Build();\napp.MapOpenApi();\napp.Run();\n",
+        "appsettings.json": _APPSETTINGS,
+        "appsettings.Development.json": _APPSETTINGS,
+        "Properties/launchSettings.json": '{\n  "profiles": {}\n}\n',
+    }
+
+
+def _xunit(nombre):
+    return {
+        f"{nombre}.csproj": _CSPROJ_XUNIT,
+        "UnitTest1.cs": f"namespace {nombre};\n\npublic class UnitTest1\n{{\n    [Fact]\n    public void Test1()\n    {{\n\n    }}\n}}\n",
+    }
+
+
+class DotnetSimulado:
+    nombre = "simulado"
+
+    def __init__(self):
+        self.registro = []  # [(cwd, comando)] en el orden en que se ejecutaron
+        self._candado = threading.Lock()
+
+    def iniciar(self, argv, cwd):
+        with self._candado:
+            self.registro.append((str(cwd or "."), shlex.join(argv)))
+        return list(argv), Path(cwd or ".")
+
+    def terminar(self, handle):
+        pass
+
+    def esperar(self, handle, emitir):
+        args, cwd = handle
+        if not args or args[0] != "dotnet":
+            emitir(f"{args[0] if args else ''}: comando no simulado", "err")
+            return 127, None, None
+        try:
+            codigo = self._dotnet(args[1:], cwd, emitir)
+        except (OSError, ValueError, IndexError) as exc:
+            emitir(f"error simulado: {exc}", "err")
+            codigo = 1
+        return codigo, None, None
+
+    def _dotnet(self, args, cwd, emitir):
+        if args[:1] == ["--version"]:
+            emitir(VERSION_SDK, "out")
+        elif args[:1] == ["new"]:
+            return self._new(args[1:], cwd, emitir)
+        elif args[:1] == ["sln"]:
+            return self._sln(args[1:], cwd, emitir)
+        elif args[:1] == ["add"] and "package" in args:
+            return self._add_package(args[1:], cwd, emitir)
+        else:
+            emitir(f"[simulado] dotnet {' '.join(args)}", "out")
+        return 0
+
+    def _new(self, args, cwd, emitir):
+        plantilla = args[0]
+        nombre = _opcion(args, "-n", "--name") or cwd.resolve().name
+        salida = _opcion(args, "-o", "--output")
+        if plantilla == "sln":
+            archivos = {f"{nombre}.sln": _SLN}
+            destino = cwd / (salida or "")
+        elif plantilla in ("webapi", "xunit"):
+            archivos = _webapi(nombre) if plantilla == "webapi" else _xunit(nombre)
+            destino = cwd / (salida or nombre)
+        else:
+            emitir(f"No se encontró la plantilla '{plantilla}' (simulado)", "err")
+            return 103
+        for relativo in archivos:
+            if (destino / relativo).exists() and "--force" not in args:
+                emitir(f"Creating this template will make changes to existing files: {relativo}", "err")
+                return 73
+        for relativo, texto in archivos.items():
+            ruta = destino / relativo
+            ruta.parent.mkdir(parents=True, exist_ok=True)
+            ruta.write_text(texto, encoding="utf-8")
+        emitir(f'The template "{plantilla}" was created successfully.', "out")
+        return 0
+
+    def _sln(self, args, cwd, emitir):
+        sln, accion, proyectos = cwd / args[0], args[1], args[2:]
+        if accion != "add":
+            emitir(f"[simulado] dotnet sln {' '.join(args)}", "out")
+            return 0
+        texto = sln.read_text(encoding="utf-8")
+        for proyecto in proyectos:
+            if not (cwd / proyecto).exists():
+                emitir(f"Project `{proyecto}` not found.", "err")
+                return 1
+            nombre = Path(proyecto).stem
+            entrada = (f'Project("{{{_TIPO_PROYECTO}}}") = "{nombre}", "{proyecto.replace("/", chr(92))}", '
+                       f'"{{{str(uuid.uuid5(uuid.NAMESPACE_URL, proyecto)).upper()}}}"\nEndProject\n')
+            if f'"{nombre}"' in texto:
+                emitir(f"Solution already contains project {proyecto}.", "out")
+                continue
+            texto = texto.replace("\nGlobal\n", "\n" + entrada + "Global\n", 1)
+            emitir(f"Project `{proyecto}` added to the solution.", "out")
+        sln.write_text(texto, encoding="utf-8")
+        return 0
+
+    def _add_package(self, args, cwd, emitir):
+        i = args.index("package")
+        proyecto = cwd / args[0] if i == 1 else next(cwd.glob("*.csproj"))
+        paquete = args[i + 1]
+        escribir_paquetes(proyecto, [(paquete, _opcion(args, "-v", "--version"), {})])
+        emitir(f"info : PackageReference for package '{paquete}' added to '{proyecto}'.", "out")
+        return 0
+
+
+def _opcion(args, *nombres):
+    for i, arg in enumerate(args[:-1]):
+        if arg in nombres:
+            return args[i + 1]
+    return None
@@ -0,0 +1,170 @@
+import os
+import shlex
+import sys
+from time import perf_counter
+
+from colores import print_info, print_error, print_ok
+from comandos import ejecutar_comando_async, preparar
+from trazas import span
+
+# Ejecutor de pasos como grafo de dependencias (DAG). Cada Tarea declara de qué
+# tareas depende y arranca en cuanto terminan todas ellas, de modo que pasos
+# independientes (p. ej. crear el proyecto xUnit mientras NuGet restaura, o
+# generar archivos mientras se instalan paquetes) corren al mismo tiempo.
+# asyncio solo coordina: cada comando se lanza con el backend activo de
+# comandos (BackendSubproceso: Popen sin shell) y su espera con wait4 corre en
+# un hilo vía asyncio.to_thread, igual que las funciones de Python. Como mucho
+# max_paralelo tareas a la vez. Al final se imprime la ruta crítica con sus tiempos.
+
+class Tarea:
+    def __init__(self, nombre, accion, depende=(), cwd=None, descripcion=None):
+        self.nombre = nombre
+        self.accion = accion  # lista argv (o str) = comando, callable = paso de Python
+        self.depende = list(depende)
+        self.cwd = cwd
+        if descripcion is None:
+            descripcion = getattr(accion, "__name__", nombre) if callable(accion) else shlex.join(preparar(accion))
+        self.descripcion = descripcion
+        self.inicio = None
+        self.fin = None
+
+    @property
+    def duracion(self):
+        return (self.fin or 0) - (self.inicio or 0)
+
+
+def validar_grafo(tareas):
+    nombres = {t.nombre for t in tareas}
+    for t in tareas:
+        faltan = [d for d in t.depende if d not in nombres]
+        if faltan:
+            raise ValueError(f"La tarea '{t.nombre}' depende de tareas inexistentes: {faltan}")
+    orden_topologico(tareas)
+
+
+def orden_topologico(tareas):
+    por_nombre = {t.nombre: t for t in tareas}
+    orden, visitando, hechas = [], set(), set()
+
+    def visitar(t):
+        if t.nombre in hechas:
+            return
+        if t.nombre in visitando:
+            raise ValueError(f"Ciclo de dependencias en '{t.nombre}'")
+        visitando.add(t.nombre)
+        for d in t.depende:
+            visitar(por_nombre[d])
+        visitando.discard(t.nombre)
+        hechas.add(t.nombre)
+        orden.append(t)
+
+    for t in tareas:
+        visitar(t)
+    return orden
+
+
+def ejecutar_grafo(tareas, max_paralelo=None):
+    import asyncio  # diferido: cuesta ~40 ms de arranque y --plan no lo usa
+    validar_grafo(tareas)
+    inicio = perf_counter()
+    try:
+        asyncio.run(_ejecutar(tareas, max_paralelo or os.cpu_count() or 1))
+    except KeyboardInterrupt:
+        print_info("\n[INTERRUPT] Ejecución interrumpida por el usuario.")
+        sys.exit(0)
+    reporte_ruta_critica(tareas, perf_counter() - inicio)
+
+
+async def _ejecutar(tareas, max_paralelo):
+    import asyncio
+    limite = asyncio.Semaphore(max_paralelo)
+    terminadas = {t.nombre: asyncio.Event() for t in tareas}
+    base = perf_counter()
+
+    async def correr(t):
+        for d in t.depende:
+            await terminadas[d].wait()
+        async with limite:
+            t.inicio = perf_counter() - base
+            if callable(t.accion):
+                await asyncio.to_thread(_medir, t)
+            else:
+                res = await ejecutar_comando_async(t.accion, cwd=t.cwd, etiqueta=t.nombre)
+                if res.returncode != 0:
+                    raise RuntimeError(t.nombre)
+            t.fin = perf_counter() - base
+        terminadas[t.nombre].set()
+
+    pendientes = [asyncio.create_task(correr(t), name=t.nombre) for t in tareas]
+    try:
+        for fut in asyncio.as_completed(pendientes):
+            await fut
+    except Exception as exc:
+        for p in pendientes:
+            p.cancel()
+        await asyncio.gather(*pendientes, return_exceptions=True)
+        print_error(f"Tarea fallida: {exc}")
+        sys.exit(1)
+
+
+def niveles(tareas):
+    # Nivel de cada tarea = largo de su cadena de dependencias; las de un mismo
+    # nivel pueden correr a la vez
+    nivel = {}
+    for t in orden_topologico(tareas):
+        nivel[t.nombre] = 1 + max((nivel[d] for d in t.depende), default=-1)
+    return nivel
+
+
+def imprimir_plan(tareas):
+    # Lista ordenada de acciones sin ejecutar nada
+    validar_grafo(tareas)
+    nivel = niveles(tareas)
+    orden = sorted(orden_topologico(tareas), key=lambda t: nivel[t.nombre])
+    print_info(f"Plan: {len(tareas)} acciones en {max(nivel.values()) + 1} niveles (mismo nivel = en paralelo)")
+    for i, t in enumerate(orden, 1):
+        tipo = "py " if callable(t.accion) else "cmd"
+        donde = f"  (en {t.cwd})" if t.cwd else ""
+        print(f"  {i:3}. [{nivel[t.nombre]}] {tipo} {t.nombre}: {t.descripcion}{donde}")
+        if t.depende:
+            print(f"            después de: {', '.join(t.depende)}")
+
+
+def _medir(t):
+    with span(t.nombre, "python"):
+        try:
+            t.accion()
+        except SystemExit as exc:
+            # Un sys.exit dentro de asyncio.to_thread no llega al manejo de
+            # errores del grafo: se convierte en una falla normal de la tarea
+            raise RuntimeError(f"{t.nombre} (código {exc.code})") from None
+
+
+def ruta_critica(tareas):
+    por_nombre = {t.nombre: t for t in tareas}
+    acumulado, previo = {}, {}
+    for t in orden_topologico(tareas):
+        mejor = max(t.depende, key=lambda d: acumulado[d], default=None)
+        acumulado[t.nombre] = t.duracion + (acumulado[mejor] if mejor else 0)
+        previo[t.nombre] = mejor
+    if not acumulado:
+        return []
+    nombre = max(acumulado, key=acumulado.get)
+    ruta = []
+    while nombre:
+        ruta.append(por_nombre[nombre])
+        nombre = previo[nombre]
+    return ruta[::-1]
+
+
+def reporte_ruta_critica(tareas, total):
+    criticas = {t.nombre for t in ruta_critica(tareas)}
+    ancho = max(len(t.nombre) for t in tareas)
+    print_info("Tiempos por tarea (* = ruta crítica):")
+    for t in sorted(tareas, key=lambda t: t.inicio or 0):
+        marca = "*" if t.nombre in criticas else " "
+        print(f"  {marca} {t.nombre:<{ancho}}  inicio {t.inicio:7.2f}s  duración {t.duracion:7.2f}s")
+    suma = sum(t.duracion for t in tareas)
+    critica = sum(t.duracion for t in tareas if t.nombre in criticas)
+    print_ok(f"Ruta crítica {critica:.2f}s, tiempo real {total:.2f}s, "
+             f"trabajo secuencial {suma:.2f}s (x{suma / total if total else 1:.1f})")
@@ -0,0 +1,98 @@
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from colores import print_info, print_ok
+
+# Spans de tiempo del scaffolding. Cada paso de Python y cada comando queda
+# como un evento con tiempo real, CPU y (para comandos) el RSS máximo del
+# proceso hijo. Se exportan en formato Chrome trace-event (abrir en
+# chrome://tracing o https://ui.perfetto.dev) y como tabla resumen.
+#
+# En pasos de Python la CPU es la del hilo que los ejecuta; en comandos es la
+# CPU de usuario + sistema del hijo (y sus descendientes) según wait4.
+
+_T0 = time.perf_counter()
+_eventos = []
+_candado = threading.Lock()
+
+
+def registrar(nombre, categoria, inicio, fin, cpu=None, rss_kb=None, **args):
+    evento = {
+        "nombre": nombre,
+        "categoria": categoria,
+        "inicio": inicio - _T0,
+        "duracion": fin - inicio,
+        "cpu": cpu,
+        "rss_kb": rss_kb,
+        "hilo": threading.get_ident(),
+        "args": args,
+    }
+    with _candado:
+        _eventos.append(evento)
+    return evento
+
+
+@contextmanager
+def span(nombre, categoria="python", **args):
+    # El bloque puede completar datos (p. ej. cpu y rss_kb de un hijo) en el dict que recibe
+    datos = {}
+    inicio, cpu = time.perf_counter(), time.thread_time()
+    try:
+        yield datos
+    finally:
+        registrar(nombre, categoria, inicio, time.perf_counter(),
+                  cpu=datos.pop("cpu", time.thread_time() - cpu), rss_kb=datos.pop("rss_kb", None), **args, **datos)
+
+
+def uso_hijo(rusage):
+    # (CPU en segundos, RSS máximo en KB) de un resultado de os.wait4
+    rss = rusage.ru_maxrss // 1024 if sys.platform == "darwin" else rusage.ru_maxrss
+    return rusage.ru_utime + rusage.ru_stime, rss
+
+
+def exportar_chrome(ruta):
+    pid = os.getpid()
+    with _candado:
+        eventos = list(_eventos)
+    hilos = {h: i for i, h in enumerate(dict.fromkeys(e["hilo"] for e in eventos))}
+    traza = [{
+        "name": e["nombre"],
+        "cat": e["categoria"],
+        "ph": "X",
+        "ts": round(e["inicio"] * 1e6),
+        "dur": round(e["duracion"] * 1e6),
+        "pid": pid,
+        "tid": hilos[e["hilo"]],
+        "args": {
+            **e["args"],
+            **({"cpu_ms": round(e["cpu"] * 1e3, 1)} if e["cpu"] is not None else {}),
+            **({"rss_hijo_kb": e["rss_kb"]} if e["rss_kb"] is not None else {}),
+        },
+    } for e in eventos]
+    ruta = Path(ruta)
+    ruta.write_text(json.dumps({"traceEvents": traza, "displayTimeUnit": "ms"}), encoding="utf-8")
+    return ruta
+
+
+def reporte():
+    with _candado:
+        eventos = sorted(_eventos, key=lambda e: e["inicio"])
+    if not eventos:
+        return
+    ancho = min(max(len(e["nombre"]) for e in eventos), 60)
+    print_info("Spans (real = tiempo de pared, cpu = hilo o proceso hijo, rss = máximo del hijo):")
+    print(f"  {'paso':<{ancho}}  {'tipo':<8} {'inicio s':>9} {'real s':>8} {'cpu s':>8} {'rss MB':>8}")
+    for e in eventos:
+        cpu = f"{e['cpu']:8.2f}" if e["cpu"] is not None else f"{'-':>8}"
+        rss = f"{e['rss_kb'] / 1024:8.1f}" if e["rss_kb"] is not None else f"{'-':>8}"
+        print(f"  {e['nombre'][:ancho]:<{ancho}}  {e['categoria']:<8} {e['inicio']:9.2f} {e['duracion']:8.2f} {cpu} {rss}")
+    comandos = [e for e in eventos if e["categoria"] == "comando"]
+    python = [e for e in eventos if e["categoria"] == "python"]
+    print_ok(f"{len(comandos)} comandos: {sum(e['duracion'] for e in comandos):.2f}s reales, "
+             f"{sum(e['cpu'] or 0 for e in comandos):.2f}s CPU de hijos; "
+             f"{len(python)} pasos de Python: {sum(e['duracion'] for e in python):.2f}s reales")
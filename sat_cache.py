@@ -0,0 +1,92 @@
+import hashlib
+import json
+import sqlite3
+import time
+
+# Caché en disco (un solo archivo SQLite) de resultados de extract_data.
+# La llave es el SHA-256 de los bytes del PDF más la versión del extractor, así
+# un cambio en los patrones invalida las entradas viejas sin borrar el archivo.
+# Al superar max_entries se eliminan las entradas usadas hace más tiempo (LRU).
+class ResultCache:
+    def __init__(self, path, version, max_entries=100_000):
+        self.path = path
+        self.version = version
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " key TEXT PRIMARY KEY, data TEXT NOT NULL, last_access REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS results_lru ON results (last_access)")
+        self._db.commit()
+        self._count = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def key(self, digest):
+        return f"{digest}:{self.version}"
+
+    def get(self, digest):
+        key = self.key(digest)
+        row = self._db.execute("SELECT data FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._db.execute("UPDATE results SET last_access = ? WHERE key = ?", (time.time(), key))
+        self._db.commit()
+        return json.loads(row[0])
+
+    def put(self, digest, data):
+        self._db.execute(
+            "INSERT OR REPLACE INTO results (key, data, last_access) VALUES (?, ?, ?)",
+            (self.key(digest), json.dumps(data, ensure_ascii=False), time.time()),
+        )
+        # _count es una cota superior (un REPLACE no agrega filas); se recalcula
+        # solo cuando parece que se rebasó el límite
+        self._count += 1
+        if self._count > self.max_entries:
+            self._count = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+            if self._count > self.max_entries:
+                self._evict(self._count - self.max_entries)
+        self._db.commit()
+
+    def _evict(self, n):
+        self._db.execute(
+            "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY last_access LIMIT ?)", (n,)
+        )
+        self._count -= n
+        self.evictions += n
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "evictions": self.evictions,
+            "entries": self._count,
+        }
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+# SHA-256 del contenido de un archivo, leído por bloques
+def file_digest(path, chunk_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        while chunk := fh.read(chunk_size):
+            h.update(chunk)
+    return h.hexdigest()
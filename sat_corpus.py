@@ -0,0 +1,164 @@
+import argparse
+import json
+import random
+import string
+from pathlib import Path
+
+import fitz  # PyMuPDF
+
+from SatScript import LABELS, NOT_FOUND
+from sat_record import curp_check_digit, rfc_check_digit
+
+# Generador de Constancias de Situación Fiscal sintéticas para pruebas de
+# rendimiento y precisión. Los PDFs llevan las etiquetas que busca extract_data
+# ("RFC:", "CURP:", "Nombre (s):", "Código Postal:", ...) y se acompañan de un
+# manifiesto JSONL con los valores esperados de cada archivo.
+#
+# layout="inline" escribe "Etiqueta: valor" en una sola línea; "columns" coloca
+# el valor en una columna separada, como en la constancia real, de modo que
+# get_text("text") puede devolver etiqueta y valor en líneas distintas;
+# "wrapped" además parte las etiquetas largas en dos renglones. Con blank > 0
+# algunos valores se dejan vacíos, como pasa con campos opcionales de la CIF.
+
+NOMBRES = ["JUAN", "MARÍA", "JOSÉ", "GUADALUPE", "LUIS", "ANA", "FRANCISCO", "SOFÍA"]
+APELLIDOS = ["LUNA", "RUIZ", "HERNÁNDEZ", "GARCÍA", "MARTÍNEZ", "LÓPEZ", "PÉREZ", "NÚÑEZ"]
+CALLES = ["AVENIDA REFORMA", "INSURGENTES SUR", "CALLE 5 DE MAYO", "BENITO JUÁREZ"]
+COLONIAS = ["CENTRO", "ROMA NORTE", "DEL VALLE", "NARVARTE"]
+MUNICIPIOS = [("CUAUHTÉMOC", "CIUDAD DE MÉXICO"), ("ZAPOPAN", "JALISCO"), ("MONTERREY", "NUEVO LEÓN")]
+RELLENO = ["Régimen", "de", "Sueldos", "y", "Salarios", "Obligaciones", "Declaración", "anual",
+           "Fecha", "inicio", "operaciones", "Actividad", "Económica", "Porcentaje", "Estatus", "ACTIVO"]
+
+MARGIN = 50
+LINE = 14
+VALUE_X = 300
+
+
+def random_identity(rnd):
+    nombre = rnd.choice(NOMBRES)
+    apellido1, apellido2 = rnd.choice(APELLIDOS), rnd.choice(APELLIDOS)
+    fecha = f"{rnd.randint(40, 99):02d}{rnd.randint(1, 12):02d}{rnd.randint(1, 28):02d}"
+    iniciales = (apellido1[0] + "AEIOU"[rnd.randint(0, 4)] + apellido2[0] + nombre[0])
+    iniciales = iniciales.translate(str.maketrans("ÁÉÍÓÚÑ", "AEIOUX"))
+    alfanum = string.ascii_uppercase + string.digits
+    municipio, estado = rnd.choice(MUNICIPIOS)
+    rfc = iniciales + fecha + "".join(rnd.choice(alfanum) for _ in range(2))
+    curp = iniciales + fecha + rnd.choice("HM") + "DF" + "".join(rnd.choice("BCDFGLMNPRST") for _ in range(3)) \
+        + rnd.choice(string.digits)
+    return {
+        "RFC": rfc + rfc_check_digit(rfc),
+        "CURP": curp + curp_check_digit(curp),
+        "Nombre": nombre,
+        "Primer Apellido": apellido1,
+        "Segundo Apellido": apellido2,
+        "Código Postal": f"{rnd.randint(1000, 99999):05d}",
+        "Calle": rnd.choice(CALLES),
+        "Número Exterior": str(rnd.randint(1, 999)),
+        "Colonia": rnd.choice(COLONIAS),
+        "Municipio": municipio,
+        "Estado": estado,
+    }
+
+
+def expected_data(identity):
+    nombre = " ".join(filter(None, (identity[k] for k in ("Nombre", "Primer Apellido", "Segundo Apellido"))))
+    data = {"RFC": identity["RFC"] or NOT_FOUND, "CURP": identity["CURP"] or NOT_FOUND, "Nombre Completo": nombre}
+    for key in ("Código Postal", "Calle", "Número Exterior", "Colonia", "Municipio", "Estado"):
+        data[key] = identity[key] or NOT_FOUND
+    return data
+
+
+def blank_fields(identity, rnd, blank):
+    """Vacía al azar campos opcionales (nunca el RFC) con probabilidad blank."""
+    return {key: "" if key != "RFC" and rnd.random() < blank else value for key, value in identity.items()}
+
+
+def _wrap(label, width=28):
+    if len(label) <= width:
+        return [label]
+    cut = label.rfind(" ", 0, width)
+    return [label[:cut], label[cut + 1:]]
+
+
+def _filler(rnd, words=8):
+    return " ".join(rnd.choice(RELLENO) for _ in range(words))
+
+
+def generate_cif_pdf(identity, pages=1, noise=0.5, layout="inline", seed=0):
+    """Devuelve los bytes de una CIF sintética con los datos de identity."""
+    rnd = random.Random(seed)
+    doc = fitz.open()
+    lines_per_page = int((792 - 2 * MARGIN) / LINE)
+    for number in range(pages):
+        page = doc.new_page(width=612, height=792)
+        y = MARGIN + LINE
+        page.insert_text((MARGIN, y), "CÉDULA DE IDENTIFICACIÓN FISCAL", fontsize=12)
+        y += 2 * LINE
+        if number == 0:
+            for _ in range(int(4 * noise)):
+                page.insert_text((MARGIN, y), _filler(rnd), fontsize=9)
+                y += LINE
+            page.insert_text((MARGIN, y), "Datos de Identificación del Contribuyente:", fontsize=10)
+            y += LINE
+            for key, (label, _pattern) in LABELS.items():
+                if layout == "inline":
+                    page.insert_text((MARGIN, y), f"{label} {identity[key]}", fontsize=9)
+                else:
+                    parts = _wrap(label) if layout == "wrapped" else [label]
+                    for part in parts[:-1]:
+                        page.insert_text((MARGIN, y), part, fontsize=9)
+                        y += LINE
+                    page.insert_text((MARGIN, y), parts[-1], fontsize=9)
+                    if identity[key]:
+                        page.insert_text((VALUE_X, y), identity[key], fontsize=9)
+                y += LINE
+                if rnd.random() < noise / 4:
+                    page.insert_text((MARGIN, y), _filler(rnd, 5), fontsize=9)
+                    y += LINE
+        while y < MARGIN + lines_per_page * LINE * noise:
+            page.insert_text((MARGIN, y), _filler(rnd, 10), fontsize=8)
+            y += LINE
+    data = doc.tobytes(garbage=3, deflate=True)
+    doc.close()
+    return data
+
+
+def generate_corpus(out_dir, count, pages=(1,), noise=0.5, layout="inline", seed=0, blank=0.0):
+    """Escribe count PDFs en out_dir y un manifest.jsonl con los valores esperados."""
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    rnd = random.Random(seed)
+    manifest = out / "manifest.jsonl"
+    with manifest.open("w", encoding="utf-8") as fh:
+        for i in range(count):
+            identity = random_identity(rnd)
+            if blank:
+                identity = blank_fields(identity, rnd, blank)
+            n_pages = rnd.choice(list(pages))
+            path = out / f"cif-{i:06d}.pdf"
+            path.write_bytes(generate_cif_pdf(identity, n_pages, noise, layout, seed=rnd.random()))
+            fh.write(json.dumps({"archivo": str(path), "paginas": n_pages, "esperado": expected_data(identity)},
+                                ensure_ascii=False) + "\n")
+    return manifest
+
+
+def load_manifest(path):
+    with open(path, encoding="utf-8") as fh:
+        return [json.loads(line) for line in fh if line.strip()]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Genera un corpus de CIF sintéticas.")
+    parser.add_argument("out_dir")
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 2, 3], help="Páginas posibles por PDF")
+    parser.add_argument("--noise", type=float, default=0.5, help="Densidad de texto de relleno (0-1)")
+    parser.add_argument("--layout", choices=["inline", "columns", "wrapped"], default="inline")
+    parser.add_argument("--blank", type=float, default=0.0, help="Probabilidad de dejar vacío un campo opcional")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    manifest = generate_corpus(args.out_dir, args.count, args.pages, args.noise, args.layout, args.seed, args.blank)
+    print(f"{args.count} PDFs generados; valores esperados en {manifest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+import re
+
+from SatScript import LABELS
+
+# Motor de extracción por coordenadas. En lugar de aplanar la página a texto,
+# lee page.get_text("words") una vez, agrupa las palabras en renglones por su
+# posición vertical e indexa cada palabra por su texto. Cada etiqueta se busca
+# en ese índice (aunque se haya partido en dos renglones) y su valor se toma de
+# las palabras a la derecha en el mismo renglón. Solo si la página está
+# maquetada en vertical (la mayoría de las etiquetas sin valor a la derecha) el
+# valor se busca en el renglón de abajo. Un campo vacío queda como no
+# encontrado en lugar de tomar el renglón siguiente, que es el error típico del
+# regex cuando la constancia deja un campo en blanco.
+
+_LABEL_TOKENS = {key: label.split() for key, (label, _value) in LABELS.items()}
+_VALUE_RES = {key: re.compile(value) for key, (_label, value) in LABELS.items()}
+
+
+class _Word:
+    __slots__ = ("x0", "y0", "x1", "y1", "text", "row")
+
+    def __init__(self, x0, y0, x1, y1, text):
+        self.x0, self.y0, self.x1, self.y1, self.text = x0, y0, x1, y1, text
+        self.row = 0
+
+
+def _split_glued(x0, y0, x1, y1, text):
+    # "Postal:06700" -> "Postal:" + "06700", repartiendo el ancho por caracteres
+    cut = text.find(":") + 1
+    if 0 < cut < len(text):
+        mid = x0 + (x1 - x0) * cut / len(text)
+        return [_Word(x0, y0, mid, y1, text[:cut]), _Word(mid, y0, x1, y1, text[cut:])]
+    return [_Word(x0, y0, x1, y1, text)]
+
+
+def page_rows(words):
+    """Agrupa las palabras en renglones visuales ordenados de arriba a abajo."""
+    items = sorted((part for w in words for part in _split_glued(*w[:5])), key=lambda w: (w.y0 + w.y1) / 2)
+    rows = []
+    center = None
+    for word in items:
+        mid = (word.y0 + word.y1) / 2
+        if center is None or mid - center > (word.y1 - word.y0) / 2:
+            rows.append([])
+            center = mid
+        rows[-1].append(word)
+    for number, row in enumerate(rows):
+        row.sort(key=lambda w: w.x0)
+        for word in row:
+            word.row = number
+    return rows
+
+
+class PageIndex:
+    """Palabras de una página en orden de lectura con un índice texto -> posiciones."""
+
+    def __init__(self, words):
+        self.rows = page_rows(words)
+        self.stream = [word for row in self.rows for word in row]
+        self.row_start = []
+        pos = 0
+        for row in self.rows:
+            self.row_start.append(pos)
+            pos += len(row)
+        self.index = {}
+        for pos, word in enumerate(self.stream):
+            self.index.setdefault(word.text, []).append(pos)
+        # Posiciones donde empieza alguna etiqueta: ahí termina cualquier valor
+        self.label_starts = set()
+        for key in LABELS:
+            for start in self.find_label(key):
+                self.label_starts.add(start)
+
+    def find_label(self, key):
+        tokens = _LABEL_TOKENS[key]
+        found = []
+        for start in self.index.get(tokens[0], ()):
+            end = start + len(tokens)
+            if end <= len(self.stream) and all(
+                self.stream[start + i].text == token for i, token in enumerate(tokens)
+            ):
+                found.append(start)
+        return found
+
+    def value_after(self, key, start, below=False):
+        last = start + len(_LABEL_TOKENS[key]) - 1
+        row = self.stream[last].row
+        if below:
+            if row + 1 >= len(self.rows):
+                return None
+            words = self._collect(self.row_start[row + 1], row + 1)
+        else:
+            words = self._collect(last + 1, row)
+        if not words:
+            return None
+        match = _VALUE_RES[key].match(" ".join(w.text for w in words))
+        return match.group(0) if match else None
+
+    def _collect(self, pos, row):
+        words = []
+        while pos < len(self.stream) and self.stream[pos].row == row:
+            if pos in self.label_starts or (words and self.stream[pos].text.endswith(":")):
+                break
+            words.append(self.stream[pos])
+            pos += 1
+        return words
+
+
+def find_fields_page(words, keys=None):
+    index = PageIndex(words)
+    positions = {}
+    for key in LABELS:
+        if keys is None or key in keys:
+            starts = index.find_label(key)
+            if starts:
+                positions[key] = starts
+
+    found = {}
+    for key, starts in positions.items():
+        for start in starts:
+            value = index.value_after(key, start)
+            if value is not None:
+                found[key] = value
+                break
+
+    # Maquetación vertical: etiqueta arriba, valor abajo
+    if len(found) * 2 < len(positions):
+        for key, starts in positions.items():
+            if key not in found:
+                for start in starts:
+                    value = index.value_after(key, start, below=True)
+                    if value is not None:
+                        found[key] = value
+                        break
+    return found
+
+
+def find_fields_layout(doc, max_pages=None, early_exit=True):
+    """Equivalente de find_fields sobre un documento abierto; devuelve (campos, páginas leídas)."""
+    found = {}
+    count = doc.page_count if max_pages is None else min(doc.page_count, max_pages)
+    pages_read = 0
+    for number in range(count):
+        pending = [key for key in LABELS if key not in found]
+        found.update(find_fields_page(doc.load_page(number).get_text("words"), pending))
+        pages_read += 1
+        if early_exit and len(found) == len(LABELS):
+            break
+    return found, pages_read
@@ -0,0 +1,121 @@
+import re
+from dataclasses import dataclass, fields
+
+from SatScript import FIELDS, NOT_FOUND
+
+# Registro compacto de una CIF. Con __slots__ cada instancia ocupa una fracción
+# de lo que ocupa el dict de extract_data, lo que importa al conciliar millones
+# de registros. Los campos ausentes son None en lugar de "No encontrado".
+
+_RFC_RE = re.compile(r"[A-ZÑ&]{3,4}\d{6}[A-Z\d]{2}[\dA]")
+_CURP_RE = re.compile(r"[A-Z][AEIOUX][A-Z]{2}\d{6}[HMX][A-Z]{2}[B-DF-HJ-NP-TV-Z]{3}[A-Z\d]\d")
+
+# Valores de cada carácter para los dígitos verificadores del SAT y RENAPO
+_RFC_VALUES = {c: i for i, c in enumerate("0123456789ABCDEFGHIJKLMN&OPQRSTUVWXYZ Ñ")}
+_CURP_VALUES = {c: i for i, c in enumerate("0123456789ABCDEFGHIJKLMNÑOPQRSTUVWXYZ")}
+
+# RFC genéricos (público en general y extranjeros) que no llevan verificador válido
+_RFC_GENERICOS = {"XAXX010101000", "XEXX010101000"}
+
+
+def rfc_check_digit(rfc12):
+    """Dígito verificador para los primeros 12 (persona física) u 11 (moral) caracteres."""
+    base = rfc12.rjust(12)
+    total = sum(_RFC_VALUES[c] * (13 - i) for i, c in enumerate(base))
+    digit = 11 - total % 11
+    return "0" if digit == 11 else "A" if digit == 10 else str(digit)
+
+
+def curp_check_digit(curp17):
+    total = sum(_CURP_VALUES[c] * (18 - i) for i, c in enumerate(curp17))
+    return str((10 - total % 10) % 10)
+
+
+def valid_rfc(rfc):
+    if not rfc or not _RFC_RE.fullmatch(rfc):
+        return False
+    return rfc in _RFC_GENERICOS or rfc_check_digit(rfc[:-1]) == rfc[-1]
+
+
+def valid_curp(curp):
+    if not curp or not _CURP_RE.fullmatch(curp):
+        return False
+    return curp_check_digit(curp[:-1]) == curp[-1]
+
+
+@dataclass(slots=True, frozen=True)
+class CifRecord:
+    rfc: str | None = None
+    curp: str | None = None
+    nombre_completo: str | None = None
+    codigo_postal: str | None = None
+    calle: str | None = None
+    numero_exterior: str | None = None
+    colonia: str | None = None
+    municipio: str | None = None
+    estado: str | None = None
+
+    @classmethod
+    def from_data(cls, data):
+        """Construye el registro a partir del dict de extract_data."""
+        values = []
+        for key in FIELDS:
+            value = data.get(key)
+            values.append(None if value in (None, "", NOT_FOUND) else value.strip())
+        return cls(*values)
+
+    def to_data(self):
+        """Inverso de from_data: dict con las llaves y el centinela de extract_data."""
+        return {key: NOT_FOUND if value is None and key != "Nombre Completo" else value or ""
+                for key, value in zip(FIELDS, self)}
+
+    def __iter__(self):
+        return (getattr(self, name) for name in self.__slots__)
+
+    @property
+    def rfc_valido(self):
+        return valid_rfc(self.rfc)
+
+    @property
+    def curp_valido(self):
+        return valid_curp(self.curp)
+
+    def errors(self):
+        """Lista de problemas de formato o dígito verificador (vacía si es válido)."""
+        errores = []
+        if self.rfc is None:
+            errores.append("RFC ausente")
+        elif not valid_rfc(self.rfc):
+            errores.append(f"RFC inválido: {self.rfc}")
+        if self.curp is not None and not valid_curp(self.curp):
+            errores.append(f"CURP inválida: {self.curp}")
+        if self.codigo_postal is not None and (len(self.codigo_postal) != 5 or not self.codigo_postal.isdigit()):
+            errores.append(f"Código Postal inválido: {self.codigo_postal}")
+        return errores
+
+
+COLUMNS = [f.name for f in fields(CifRecord)]
+
+
+def to_columns(records, validity=True):
+    """Convierte un lote de registros en columnas {nombre: lista}.
+
+    El resultado se puede pasar tal cual a pyarrow.table() o a
+    numpy.array(..., dtype=object) sin construir un dict por registro.
+    Con validity se agregan las columnas booleanas rfc_valido y curp_valido.
+    """
+    rows = [tuple(r) for r in records]
+    columns = dict(zip(COLUMNS, map(list, zip(*rows)))) if rows else {name: [] for name in COLUMNS}
+    if validity:
+        columns["rfc_valido"] = [valid_rfc(v) for v in columns["rfc"]]
+        columns["curp_valido"] = [valid_curp(v) for v in columns["curp"]]
+    return columns
+
+
+def to_arrow(records, validity=True):
+    """Tabla de pyarrow con los registros (requiere pyarrow instalado)."""
+    try:
+        import pyarrow as pa
+    except ImportError as exc:
+        raise ImportError("to_arrow requiere pyarrow: pip install pyarrow") from exc
+    return pa.table(to_columns(records, validity))
@@ -0,0 +1,232 @@
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import SatScript
+
+# Servicio HTTP mínimo (solo biblioteca estándar) que expone extract_data:
+#   POST /cif      cuerpo = bytes del PDF  ->  JSON con los campos extraídos
+#   GET  /metrics  peticiones en curso, profundidad de cola y percentiles de latencia
+# El trabajo de PyMuPDF corre en un pool de procesos acotado. Como mucho
+# max_in_flight PDFs se procesan a la vez; hasta max_queue peticiones esperan
+# turno y el resto recibe 503 de inmediato (backpressure).
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           411: "Length Required", 413: "Payload Too Large", 431: "Request Header Fields Too Large",
+           422: "Unprocessable Entity", 503: "Service Unavailable", 504: "Gateway Timeout"}
+
+
+class Metrics:
+    def __init__(self, window=2048):
+        self.latencies = deque(maxlen=window)
+        self.in_flight = 0
+        self.waiting = 0
+        self.requests = 0
+        self.rejected = 0
+        self.timeouts = 0
+        self.errors = 0
+
+    def observe(self, seconds):
+        self.latencies.append(seconds)
+
+    def snapshot(self):
+        ordered = sorted(self.latencies)
+
+        def pct(p):
+            if not ordered:
+                return None
+            return round(ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * 1000, 2)
+
+        return {
+            "in_flight": self.in_flight,
+            "queue_depth": self.waiting,
+            "requests": self.requests,
+            "rejected": self.rejected,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "latency_ms": {"p50": pct(50), "p90": pct(90), "p99": pct(99), "samples": len(ordered)},
+        }
+
+
+class CifServer:
+    def __init__(self, workers=None, max_in_flight=None, max_queue=64, timeout=30.0,
+                 max_body=20 * 1024 * 1024, max_pages=None):
+        workers = workers or os.cpu_count()
+        self.pool = ProcessPoolExecutor(max_workers=workers)
+        self.max_in_flight = max_in_flight or workers * 2
+        self.slots = asyncio.Semaphore(self.max_in_flight)
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.max_body = max_body
+        self.extract = partial(SatScript.extract_from_source, max_pages=max_pages)
+        self.metrics = Metrics()
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, path, headers, body, status = request
+                if status is None:
+                    status, payload = await self._dispatch(method, path.split("?", 1)[0], body)
+                else:
+                    payload = {"error": REASONS[status]}
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await self._respond(writer, status, payload, keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader):
+        # Una línea más larga que el límite del StreamReader (64 KiB) hace que
+        # readline lance ValueError; en ambos casos se responde y se cierra
+        try:
+            line = await reader.readline()
+        except ValueError:
+            return "", "", {"connection": "close"}, b"", 400
+        if not line:
+            return None
+        try:
+            method, path, _ = line.decode("latin-1").split(" ", 2)
+        except ValueError:
+            return "", "", {"connection": "close"}, b"", 400
+        headers = {}
+        while True:
+            try:
+                line = await reader.readline()
+            except ValueError:
+                return method, path, {"connection": "close"}, b"", 431
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        body = b""
+        if method == "POST":
+            if "content-length" not in headers:
+                return method, path, {"connection": "close"}, body, 411
+            try:
+                length = int(headers["content-length"])
+            except ValueError:
+                length = -1
+            if length < 0:
+                return method, path, {"connection": "close"}, body, 400
+            if length > self.max_body:
+                return method, path, {"connection": "close"}, body, 413
+            body = await reader.readexactly(length)
+        return method, path, headers, body, None
+
+    async def _dispatch(self, method, path, body):
+        if path == "/metrics":
+            if method != "GET":
+                return 405, {"error": REASONS[405]}
+            return 200, self.metrics.snapshot()
+        if path != "/cif":
+            return 404, {"error": REASONS[404]}
+        if method != "POST":
+            return 405, {"error": REASONS[405]}
+        if not body:
+            return 400, {"error": "Cuerpo vacío; envía los bytes del PDF"}
+        return await self._extract(body)
+
+    async def _extract(self, body):
+        m = self.metrics
+        m.requests += 1
+        if self.slots.locked() and m.waiting >= self.max_queue:
+            m.rejected += 1
+            return 503, {"error": "Servicio saturado, reintenta más tarde"}
+
+        # El timeout cubre toda la petición: la espera en cola y la extracción
+        inicio = time.perf_counter()
+        limite = inicio + self.timeout
+        m.waiting += 1
+        try:
+            await asyncio.wait_for(self.slots.acquire(), self.timeout)
+        except asyncio.TimeoutError:
+            m.timeouts += 1
+            m.observe(time.perf_counter() - inicio)
+            return 504, {"error": f"La petición esperó turno más de {self.timeout}s"}
+        finally:
+            m.waiting -= 1
+
+        # El lugar se libera cuando el proceso termina de verdad, no cuando vence
+        # el timeout: así el límite refleja el trabajo real que hay en el pool.
+        m.in_flight += 1
+        future = asyncio.get_running_loop().run_in_executor(self.pool, self.extract, body)
+        future.add_done_callback(self._release)
+        try:
+            restante = max(limite - time.perf_counter(), 0)
+            data, _pages = await asyncio.wait_for(asyncio.shield(future), restante)
+        except asyncio.TimeoutError:
+            m.timeouts += 1
+            return 504, {"error": f"La extracción excedió {self.timeout}s"}
+        except Exception as exc:
+            m.errors += 1
+            return 422, {"error": f"{type(exc).__name__}: {exc}"}
+        finally:
+            m.observe(time.perf_counter() - inicio)
+        return 200, data
+
+    def _release(self, _future):
+        self.metrics.in_flight -= 1
+        self.slots.release()
+
+    async def _respond(self, writer, status, payload, keep_alive):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+        )
+        if status == 503:
+            head += "Retry-After: 1\r\n"
+        writer.write(head.encode("latin-1") + b"\r\n" + body)
+        await writer.drain()
+
+    def close(self):
+        self.pool.shutdown(cancel_futures=True)
+
+
+async def serve(host, port, **options):
+    app = CifServer(**options)
+    server = await asyncio.start_server(app.handle, host, port)
+    print(f"Escuchando en http://{host}:{port} (POST /cif, GET /metrics)")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        app.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Servicio HTTP de extracción de CIF del SAT.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Procesos para PyMuPDF")
+    parser.add_argument("--max-in-flight", type=int, help="PDFs procesándose a la vez (default: 2 x workers)")
+    parser.add_argument("--max-queue", type=int, default=64, help="Peticiones en espera antes de responder 503")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Segundos máximos por petición")
+    parser.add_argument("--max-body", type=int, default=20 * 1024 * 1024, help="Tamaño máximo del PDF en bytes")
+    parser.add_argument("--max-pages", type=int, help="Leer como máximo N páginas por PDF")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(
+            args.host, args.port, workers=args.workers, max_in_flight=args.max_in_flight,
+            max_queue=args.max_queue, timeout=args.timeout, max_body=args.max_body, max_pages=args.max_pages,
+        ))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
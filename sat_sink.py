@@ -0,0 +1,106 @@
+import csv
+import io
+import json
+import os
+import stat
+import sys
+
+# Escritor en streaming de registros CIF (un objeto JSON o una fila CSV por PDF).
+# Los registros se acumulan en lotes acotados y cada lote se escribe con una sola
+# llamada os.write() sobre un descriptor O_APPEND seguida de fsync, así la memoria
+# no crece con el tamaño de la entrada y un lote nunca se mezcla con otro.
+# Por defecto el archivo se trunca al abrirlo; con append se continúa y, si el
+# proceso murió a mitad de una escritura, se recorta la última línea incompleta
+# para no dejar registros a medias. fsync y la reparación solo aplican a archivos
+# regulares (no a /dev/null, FIFOs o /dev/stdout).
+class RecordSink:
+    def __init__(self, path, fmt="jsonl", fieldnames=None, batch_size=100, append=False):
+        if fmt not in ("jsonl", "csv"):
+            raise ValueError(f"Formato no soportado: {fmt}")
+        if fmt == "csv" and not fieldnames:
+            raise ValueError("El formato csv requiere fieldnames")
+        self.path = path
+        self.fmt = fmt
+        self.fieldnames = list(fieldnames or [])
+        self.batch_size = max(1, batch_size)
+        self.written = 0
+        self._batch = []
+
+        if path == "-":
+            self._fd = sys.stdout.fileno()
+            self._is_file = False
+            empty = True
+        else:
+            flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+            if not append:
+                flags |= os.O_TRUNC
+            self._fd = os.open(path, flags, 0o644)
+            self._is_file = stat.S_ISREG(os.fstat(self._fd).st_mode)
+            empty = not (append and self._is_file) or _repair_tail(path) == 0
+
+        if fmt == "csv" and empty:
+            self._batch.append(self._csv_line(dict(zip(self.fieldnames, self.fieldnames))))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def write(self, record):
+        if self.fmt == "jsonl":
+            line = json.dumps(record, ensure_ascii=False) + "\n"
+        else:
+            line = self._csv_line(record)
+        self._batch.append(line)
+        self.written += 1
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if not self._batch:
+            return
+        data = "".join(self._batch).encode("utf-8")
+        self._batch.clear()
+        view = memoryview(data)
+        while view:
+            n = os.write(self._fd, view)
+            view = view[n:]
+        if self._is_file:
+            os.fsync(self._fd)
+
+    def close(self):
+        if self._fd is None:
+            return
+        self.flush()
+        if self.path != "-":
+            os.close(self._fd)
+        self._fd = None
+
+    def _csv_line(self, record):
+        buf = io.StringIO()
+        csv.DictWriter(buf, self.fieldnames, restval="", extrasaction="ignore", lineterminator="\n").writerow(record)
+        return buf.getvalue()
+
+# Recorta el archivo hasta el último salto de línea y devuelve su tamaño final
+def _repair_tail(path):
+    with open(path, "rb+") as fh:
+        size = fh.seek(0, os.SEEK_END)
+        if size == 0:
+            return 0
+        fh.seek(size - 1)
+        if fh.read(1) == b"\n":
+            return size
+        # Buscar hacia atrás el último registro completo
+        pos = size
+        while pos > 0:
+            step = min(4096, pos)
+            pos -= step
+            fh.seek(pos)
+            chunk = fh.read(step)
+            idx = chunk.rfind(b"\n")
+            if idx != -1:
+                fh.truncate(pos + idx + 1)
+                return pos + idx + 1
+        fh.truncate(0)
+        return 0
@@ -0,0 +1,38 @@
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "create-.Net"))
+
+from imagen_docker import BASES, combinaciones, generar_dockerfile  # noqa: E402
+
+
+def _propiedades(dockerfile, comando):
+    # Flags (-r, -p:...) de la instrucción que contiene `comando`
+    instruccion = next(i for i in re.split(r"\n(?=[A-Z])", dockerfile) if comando in i)
+    return sorted(re.findall(r"(-r \$RID|-p:\S+)", instruccion))
+
+
+def test_cada_combinacion_de_opciones():
+    vistas = list(combinaciones())
+    assert len(vistas) == len({tuple(sorted(o.items())) for o in vistas})
+    assert {o["base"] for o in vistas} == set(BASES)
+
+    for opciones in vistas:
+        texto = generar_dockerfile("Api", opciones)
+        contexto = f"opciones: {opciones}"
+
+        assert texto.count("dotnet publish") == 1, contexto
+        assert "dotnet build" not in texto, contexto
+        assert not re.search(r"^COPY .*\.db", texto, re.M), contexto
+        assert ("--mount=type=cache" in texto) == opciones["cache_nuget"], contexto
+        assert ("-p:PublishReadyToRun=true" in texto) == opciones["r2r"], contexto
+        assert ("-p:PublishTrimmed=true" in texto) == opciones["recortado"], contexto
+        assert ("-p:InvariantGlobalization=true" in texto) == opciones["invariante"], contexto
+        assert ("DOTNET_SYSTEM_GLOBALIZATION_INVARIANT=true" in texto) == opciones["invariante"], contexto
+        assert ("-p:TieredPGO=true" in texto) == opciones["pgo"], contexto
+        assert ("runtime-deps" in texto) == opciones["autocontenido"], contexto
+        if opciones["recortado"]:
+            assert opciones["autocontenido"], contexto
+        # El restore recibe las mismas propiedades que el publish (--no-restore)
+        assert _propiedades(texto, "dotnet restore") == _propiedades(texto, "dotnet publish"), contexto
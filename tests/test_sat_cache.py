@@ -0,0 +1,42 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from SatScript import extract_batch  # noqa: E402
+from sat_cache import ResultCache, file_digest  # noqa: E402
+
+
+def test_duplicados_de_un_pdf_corrupto_reciben_el_mismo_error(tmp_path):
+    # Dos archivos con el mismo contenido roto: se extrae uno y el otro hereda su error
+    rutas = []
+    for nombre in ("bad1.pdf", "bad2.pdf"):
+        ruta = tmp_path / nombre
+        ruta.write_bytes(b"no es un pdf")
+        rutas.append(str(ruta))
+
+    with ResultCache(str(tmp_path / "c.db"), "test") as cache:
+        resultados = list(extract_batch(rutas, workers=1, cache=cache))
+
+    assert [r[0] for r in resultados] == rutas
+    assert all(r[1] is None and r[3] for r in resultados)
+    assert resultados[0][3] == resultados[1][3]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_duplicados_en_cache_cuentan_como_aciertos(tmp_path):
+    # 4 entradas con 2 contenidos distintos, ambos ya en caché: 4 aciertos
+    rutas = []
+    for i in range(4):
+        ruta = tmp_path / f"cif{i}.pdf"
+        ruta.write_bytes(b"contenido %d" % (i % 2))
+        rutas.append(str(ruta))
+
+    with ResultCache(str(tmp_path / "c.db"), "test") as cache:
+        for ruta in rutas[:2]:
+            cache.put(file_digest(ruta), {"rfc": ruta})
+        resultados = list(extract_batch(rutas, workers=1, cache=cache))
+        stats = cache.stats()
+
+    assert [r[1]["rfc"] for r in resultados] == rutas[:2] * 2
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (4, 0, 1.0)